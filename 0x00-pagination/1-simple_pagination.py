@@ -6,8 +6,9 @@ This module defines a Server class
 for paginating a database of popular baby names.
 """
 
-import csv
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
+
+from storage import open_dataset
 
 
 class Server:
@@ -18,17 +19,26 @@ class Server:
 
     DATA_FILE = "Popular_Baby_Names.csv"
 
-    def __init__(self):
-        """Initialize the Server instance."""
+    def __init__(self, storage: str = "list", workers: int = None):
+        """
+        Initialize the Server instance.
+
+        Parameters:
+            - storage (str): How the dataset is held in memory,
+            see storage.open_dataset.
+            - workers (int): Parse the CSV file in this many processes,
+            None to parse it in this process.
+        """
+        self.storage = storage
+        self.workers = workers
         self.__dataset = None
 
-    def dataset(self) -> List[List]:
+    def dataset(self) -> Sequence[List]:
         """Get the cached dataset."""
         if self.__dataset is None:
-            with open(self.DATA_FILE) as f:
-                reader = csv.reader(f)
-                dataset = [row for row in reader]
-            self.__dataset = dataset[1:]
+            self.__dataset = open_dataset(
+                self.DATA_FILE, self.storage, self.workers
+            )
 
         return self.__dataset
 
@@ -5,11 +5,29 @@ Pagination for Baby Names Database
 This module defines a Server class for paginating a database
 of popular baby names and introduces a get_hyper function
 to provide enhanced pagination functionality.
+
+The Server also provides:
+    - column filters for get_hyper, backed by inverted indexes.
+    - get_after, keyset (cursor) pagination in any column order.
+    - autocomplete, paginated first name suggestions.
+    - iter_pages and get_pages, streaming and batched page access.
+    - an opt-in get_hyper response cache built on the 0x01-caching
+    eviction policies.
+    - get_aggregate, paginated group-by / sum / rank queries
+    (requires NumPy).
+    - refresh, picking up rows appended to the CSV file.
 """
 
-import csv
 import math
-from typing import List, Tuple
+import os
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from page_view import PageView
+from posting_index import PostingIndex, fold, intersect
+from prefix_index import PrefixIndex
+from sort_index import SortIndex, decode_cursor, encode_cursor
+from storage import extend_dataset, load_dataset, read_header
 
 
 class Server:
@@ -19,21 +37,233 @@ class Server:
     """
 
     DATA_FILE = "Popular_Baby_Names.csv"
+    NAME_COLUMN = "Child's First Name"
+    COUNT_COLUMN = "Count"
+    FILTER_CACHE_SIZE = 128
 
-    def __init__(self):
-        """Initialize the Server instance."""
+    def __init__(self, storage: str = "list", workers: int = None, cache=None):
+        """
+        Initialize the Server instance.
+
+        Parameters:
+            - storage (str): How the dataset is held in memory,
+            see storage.open_dataset.
+            - workers (int): Parse the CSV file in this many processes,
+            None to parse it in this process.
+            - cache: An instance of a 0x01-caching policy
+            (e.g. LRUCache(on_evict=lambda key, item: None)) memoizing
+            get_hyper responses, None to disable response caching.
+            Its default on_evict prints every evicted response key.
+        """
+        self.storage = storage
+        self.workers = workers
+        self.cache = cache
+        self.__generation = 0
+        self.__total_pages = {}
         self.__dataset = None
+        self.__end = 0
+        self.__header = None
+        self.__sort_indexes = {}
+        self.__posting_indexes = {}
+        self.__filtered = OrderedDict()
+        self.__prefix_index = None
+        self.__table = None
+        self.__aggregates = {}
 
-    def dataset(self) -> List[List]:
+    def dataset(self) -> Sequence[List]:
         """Get the cached dataset."""
         if self.__dataset is None:
-            with open(self.DATA_FILE) as f:
-                reader = csv.reader(f)
-                dataset = [row for row in reader]
-            self.__dataset = dataset[1:]
+            self.__dataset, self.__end = load_dataset(
+                self.DATA_FILE, self.storage, self.workers
+            )
 
         return self.__dataset
 
+    @property
+    def generation(self) -> int:
+        """The number of times the dataset was reloaded or refreshed."""
+        return self.__generation
+
+    def reload(self) -> None:
+        """
+        Drop the cached dataset and everything derived from it.
+        """
+        self.next_generation()
+        self.__total_pages = {}
+        self.__dataset = None
+        self.__header = None
+        self.__sort_indexes = {}
+        self.__posting_indexes = {}
+        self.__filtered = OrderedDict()
+        self.__prefix_index = None
+        self.__table = None
+        self.__aggregates = {}
+
+    def next_generation(self) -> None:
+        """
+        Start a new dataset generation and empty the response cache.
+
+        Responses are keyed by generation, so the old ones could never
+        be served again, but frequency based policies (LFU, ARC,
+        TinyLFU) would keep them over the new ones.
+        """
+        self.__generation += 1
+        if self.cache is not None:
+            self.cache.clear()
+
+    def refresh(self) -> int:
+        """
+        Pick up the rows appended to the CSV file since it was loaded.
+
+        Only the new tail of the file is parsed. The dataset and the
+        posting, sort, autocomplete and aggregation indexes grow in
+        place. Memoized results and cached responses are dropped. If the
+        file shrank it was rewritten, and everything is reloaded.
+
+        Returns:
+            int: The number of rows added.
+        """
+        if self.__dataset is None:
+            return 0
+        if os.path.getsize(self.DATA_FILE) < self.__end:
+            self.reload()
+            return 0
+
+        size = len(self.__dataset)
+        self.__dataset, self.__end = extend_dataset(
+            self.__dataset, self.DATA_FILE, self.__end,
+            self.storage, self.workers
+        )
+        added = len(self.__dataset) - size
+        if added:
+            for index in self.__posting_indexes.values():
+                index.extend(self.__dataset, size)
+            for column, index in list(self.__sort_indexes.items()):
+                if not index.extend(self.__dataset, size):
+                    del self.__sort_indexes[column]
+            if self.__prefix_index is not None:
+                self.__prefix_index.extend(self.__dataset, size)
+            if self.__table is not None and not self.__table.extend(
+                self.__dataset[size:]
+            ):
+                self.__table = None
+            self.next_generation()
+            self.__total_pages = {}
+            self.__filtered = OrderedDict()
+            self.__aggregates = {}
+        return added
+
+    def total_pages(self, page_size: int) -> int:
+        """Get the memoized number of pages of the whole dataset."""
+        if page_size not in self.__total_pages:
+            self.__total_pages[page_size] = math.ceil(
+                len(self.dataset()) / page_size
+            )
+
+        return self.__total_pages[page_size]
+
+    def header(self) -> List[str]:
+        """Get the column names of the dataset."""
+        if self.__header is None:
+            self.__header = read_header(self.DATA_FILE)
+
+        return self.__header
+
+    def sort_index(self, column: str) -> SortIndex:
+        """
+        Get the cached sort order of the dataset for a column.
+
+        Parameters:
+            - column (str): The column name.
+
+        Returns:
+            SortIndex: The rows sorted by the column.
+        """
+        if column not in self.__sort_indexes:
+            position = self.header().index(column)
+            self.__sort_indexes[column] = SortIndex(self.dataset(), position)
+
+        return self.__sort_indexes[column]
+
+    def posting_index(self, column: str) -> PostingIndex:
+        """
+        Get the cached inverted index of the dataset for a column.
+
+        Parameters:
+            - column (str): The column name.
+
+        Returns:
+            PostingIndex: The rows holding each value of the column.
+        """
+        if column not in self.__posting_indexes:
+            position = self.header().index(column)
+            self.__posting_indexes[column] = PostingIndex(
+                self.dataset(), position
+            )
+
+        return self.__posting_indexes[column]
+
+    def prefix_index(self) -> PrefixIndex:
+        """Get the cached autocomplete index of the first names."""
+        if self.__prefix_index is None:
+            header = self.header()
+            self.__prefix_index = PrefixIndex(
+                self.dataset(),
+                header.index(self.NAME_COLUMN),
+                header.index(self.COUNT_COLUMN),
+            )
+
+        return self.__prefix_index
+
+    def table(self):
+        """
+        Get the cached NumPy columns of the dataset.
+
+        Returns:
+            aggregate.Table: The table aggregations run on.
+        """
+        if self.__table is None:
+            from aggregate import Table
+
+            self.__table = Table(self.dataset(), self.header())
+
+        return self.__table
+
+    def filter_rows(self, filters: Dict[str, str]) -> Sequence[int]:
+        """
+        Find the rows matching every filter.
+
+        The intersection is memoized per set of filters, so paging
+        through a filtered view only intersects the posting lists once.
+        Only the FILTER_CACHE_SIZE most recently used sets are kept.
+
+        Parameters:
+            - filters (Dict[str, str]): Column name to value, values are
+            compared case-insensitively (e.g. {"Gender": "female"}).
+
+        Returns:
+            Sequence[int]: The sorted indexes of the matching rows.
+        """
+        for column in filters:
+            assert column in self.header(), "unknown column: {}".format(
+                column
+            )
+
+        key = tuple(sorted(
+            (column, fold(value)) for column, value in filters.items()
+        ))
+        if key in self.__filtered:
+            self.__filtered.move_to_end(key)
+            return self.__filtered[key]
+        rows = intersect([
+            self.posting_index(column).get(value)
+            for column, value in key
+        ])
+        self.__filtered[key] = rows
+        while len(self.__filtered) > self.FILTER_CACHE_SIZE:
+            self.__filtered.popitem(last=False)
+        return rows
+
     def get_page(self, page: int = 1, page_size: int = 10) -> List[List]:
         """
         Retrieve a page of baby names from the database.
@@ -51,13 +281,60 @@ class Server:
         [start, end] = index_range(page, page_size)
         return self.dataset()[start:end]
 
-    def get_hyper(self, page: int, page_size: int) -> dict:
+    def iter_pages(self, page_size: int = 10,
+                   start: int = 1) -> Iterator[PageView]:
+        """
+        Lazily yield every page of the dataset from a given page on.
+
+        Pages are views over the dataset, so streaming the whole dataset
+        never copies it.
+
+        Parameters:
+            - page_size (int): The number of items per page.
+            - start (int): The first page number (1-indexed).
+
+        Yields:
+            PageView: The rows of each page.
+        """
+        assert isinstance(start, int) and isinstance(page_size, int)
+        assert start > 0 and page_size > 0
+
+        dataset = self.dataset()
+        [first, _] = index_range(start, page_size)
+        for offset in range(first, len(dataset), page_size):
+            yield PageView(dataset, offset, offset + page_size)
+
+    def get_pages(self, pages: List[int],
+                  page_size: int = 10) -> List[PageView]:
+        """
+        Retrieve several pages of the same size at once.
+
+        Parameters:
+            - pages (List[int]): The page numbers (1-indexed).
+            - page_size (int): The number of items per page.
+
+        Returns:
+            List[PageView]: The rows of each page, in the order asked.
+        """
+        assert isinstance(page_size, int) and page_size > 0
+        assert all(isinstance(page, int) and page > 0 for page in pages)
+
+        dataset = self.dataset()
+        return [
+            PageView(dataset, *index_range(page, page_size))
+            for page in pages
+        ]
+
+    def get_hyper(self, page: int, page_size: int,
+                  filters: Dict[str, str] = None) -> dict:
         """
         Retrieve enhanced pagination information for a specified page.
 
         Parameters:
             - page (int): The page number (1-indexed).
             - page_size (int): The number of items per page.
+            - filters (Dict[str, str]): Optional column name to value
+            filters, pages then only cover the matching rows.
 
         Returns:
             dict: A dictionary containing pagination details:
@@ -70,11 +347,29 @@ class Server:
                 None if no previous page.
                 - total_pages: the total number of pages in
                 the dataset as an integer.
+            Responses are shared with the cache, if any, and must not
+            be modified.
         """
-        dataset = self.get_page(page, page_size)
-        total_pages = math.ceil(len(self.__dataset) / page_size)
+        key = None
+        if self.cache is not None:
+            key = (self.__generation, page, page_size,
+                   tuple(sorted(filters.items())) if filters else None)
+            response = self.cache.get(key)
+            if response is not None:
+                return response
 
-        return {
+        if filters:
+            assert isinstance(page, int) and isinstance(page_size, int)
+            assert page > 0 and page_size > 0
+            rows = self.filter_rows(filters)
+            [start, end] = index_range(page, page_size)
+            dataset = [self.dataset()[i] for i in rows[start:end]]
+            total_pages = math.ceil(len(rows) / page_size)
+        else:
+            dataset = self.get_page(page, page_size)
+            total_pages = self.total_pages(page_size)
+
+        response = {
             "page_size": len(dataset),
             "page": page,
             "data": dataset,
@@ -82,6 +377,149 @@ class Server:
             "prev_page": page - 1 if (page - 1) > 0 else None,
             "total_pages": total_pages,
         }
+        if key is not None:
+            self.cache.put(key, response)
+        return response
+
+    def get_after(self, cursor: str = None, page_size: int = 10,
+                  order_by: str = "Count") -> Dict:
+        """
+        Retrieve the page following a cursor in a given order.
+
+        Parameters:
+            - cursor (str): The next_cursor of the previous page,
+            None for the first page.
+            - page_size (int): The number of items per page.
+            - order_by (str): The column to sort by, prefixed with "-"
+            for descending order (e.g. "-Count").
+
+        Returns:
+            dict: A dictionary containing pagination details:
+                - page_size: the length of the returned dataset page.
+                - order_by: the sort order of the pages.
+                - cursor: the cursor the page was requested with.
+                - data: the dataset page.
+                - next_cursor: the cursor of the next page,
+                None if no next page.
+        """
+        assert isinstance(page_size, int) and page_size > 0
+        descending = order_by.startswith("-")
+        column = order_by[1:] if descending else order_by
+        assert column in self.header(), "unknown column: {}".format(column)
+
+        index = self.sort_index(column)
+        key = None
+        if cursor is not None:
+            key = decode_cursor(order_by, cursor)
+            assert key is not None and (
+                type(key[0]) is (int if index.numeric else str)
+            ), "invalid cursor"
+
+        rows, more = index.after(key, page_size, descending)
+        dataset = self.dataset()
+        data = [dataset[i] for i in rows]
+
+        return {
+            "page_size": len(data),
+            "order_by": order_by,
+            "cursor": cursor,
+            "data": data,
+            "next_cursor": (
+                encode_cursor(order_by, index.key(rows[-1])) if more else None
+            ),
+        }
+
+    def autocomplete(self, prefix: str, page: int = 1,
+                     page_size: int = 10) -> dict:
+        """
+        Retrieve a page of first names starting with a prefix.
+
+        Names are deduplicated case-insensitively and ranked by their
+        total count across the dataset.
+
+        Parameters:
+            - prefix (str): The typed prefix, compared case-insensitively.
+            - page (int): The page number (1-indexed).
+            - page_size (int): The number of items per page.
+
+        Returns:
+            dict: The same pagination details as get_hyper, with data
+            holding [name, total count] pairs.
+        """
+        assert isinstance(prefix, str)
+        assert isinstance(page, int) and isinstance(page_size, int)
+        assert page > 0 and page_size > 0
+
+        index = self.prefix_index()
+        matches = index.search(prefix)
+        [start, end] = index_range(page, page_size)
+        data = [[index.names[i], index.totals[i]] for i in matches[start:end]]
+        total_pages = math.ceil(len(matches) / page_size)
+
+        return {
+            "page_size": len(data),
+            "page": page,
+            "data": data,
+            "next_page": page + 1 if (page + 1) <= total_pages else None,
+            "prev_page": page - 1 if (page - 1) > 0 else None,
+            "total_pages": total_pages,
+        }
+
+    def get_aggregate(self, page: int, page_size: int, group_by: List[str],
+                      value: str = "Count", partition_by: List[str] = None,
+                      top: int = None) -> dict:
+        """
+        Retrieve a page of an aggregation of the dataset.
+
+        Results are computed with NumPy once per query and cached until
+        the dataset is reloaded.
+
+        Examples:
+            - total count per first name:
+            group_by=["Child's First Name"]
+            - top 10 names per ethnicity per year:
+            group_by=["Ethnicity", "Year of Birth", "Child's First Name"],
+            partition_by=["Ethnicity", "Year of Birth"], top=10
+
+        Parameters:
+            - page (int): The page number (1-indexed).
+            - page_size (int): The number of items per page.
+            - group_by (List[str]): The columns identifying a group.
+            - value (str): The integer column to sum.
+            - partition_by (List[str]): Columns among group_by to rank
+            groups within, None to rank all groups together.
+            - top (int): Keep only this many groups per partition.
+
+        Returns:
+            dict: The same pagination details as get_hyper, with data
+            holding the group_by values, the sum and the rank of each
+            group.
+        """
+        assert isinstance(page, int) and isinstance(page_size, int)
+        assert page > 0 and page_size > 0
+        for column in [*group_by, value, *(partition_by or [])]:
+            assert column in self.header(), "unknown column: {}".format(
+                column
+            )
+
+        key = (tuple(group_by), value, tuple(partition_by or []), top)
+        if key not in self.__aggregates:
+            self.__aggregates[key] = self.table().group_sum(
+                group_by, value, partition_by, top
+            )
+        rows = self.__aggregates[key]
+        [start, end] = index_range(page, page_size)
+        data = rows[start:end]
+        total_pages = math.ceil(len(rows) / page_size)
+
+        return {
+            "page_size": len(data),
+            "page": page,
+            "data": data,
+            "next_page": page + 1 if (page + 1) <= total_pages else None,
+            "prev_page": page - 1 if (page - 1) > 0 else None,
+            "total_pages": total_pages,
+        }
 
 
 def index_range(page: int, page_size: int) -> Tuple[int, int]:
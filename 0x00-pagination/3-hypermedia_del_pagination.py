@@ -4,10 +4,15 @@ Deletion-resilient Hypermedia Pagination
 
 This module defines a Server class for handling pagination of a database
 of popular baby names with deletion-resilient hypermedia pagination.
+Rows appended to the CSV file are picked up by refresh without
+invalidating the indexes already handed out.
 """
 
-import csv
-from typing import List, Dict
+import os
+from typing import List, Dict, Mapping, Sequence
+
+from live_index import LiveIndex
+from storage import extend_dataset, load_dataset
 
 
 class Server:
@@ -15,34 +20,73 @@ class Server:
 
     DATA_FILE = "Popular_Baby_Names.csv"
 
-    def __init__(self):
-        """Initialize the Server instance."""
+    def __init__(self, storage: str = "list", workers: int = None):
+        """
+        Initialize the Server instance.
+
+        Parameters:
+            - storage (str): How the dataset is held in memory,
+            see storage.open_dataset.
+            - workers (int): Parse the CSV file in this many processes,
+            None to parse it in this process.
+        """
+        self.storage = storage
+        self.workers = workers
         self.__dataset = None
         self.__indexed_dataset = None
+        self.__end = 0
 
-    def dataset(self) -> List[List]:
+    def dataset(self) -> Sequence[List]:
         """Get the cached dataset."""
         if self.__dataset is None:
-            with open(self.DATA_FILE) as f:
-                reader = csv.reader(f)
-                dataset = [row for row in reader]
-            self.__dataset = dataset[1:]
+            self.__dataset, self.__end = load_dataset(
+                self.DATA_FILE, self.storage, self.workers
+            )
 
         return self.__dataset
 
-    def indexed_dataset(self) -> Dict[int, List]:
+    def refresh(self) -> int:
+        """
+        Pick up the rows appended to the CSV file since it was loaded.
+
+        Only the new tail of the file is parsed. The dataset and the
+        indexed dataset grow in place, deleted rows stay deleted and
+        every index handed out by get_hyper_index stays valid. If the
+        file shrank it was rewritten, and everything is loaded again.
+
+        Returns:
+            int: The number of rows added.
+        """
+        if self.__dataset is None:
+            return 0
+        if os.path.getsize(self.DATA_FILE) < self.__end:
+            self.__dataset = None
+            self.__indexed_dataset = None
+            return 0
+
+        size = len(self.__dataset)
+        self.__dataset, self.__end = extend_dataset(
+            self.__dataset, self.DATA_FILE, self.__end,
+            self.storage, self.workers
+        )
+        added = len(self.__dataset) - size
+        if self.__indexed_dataset is not None:
+            self.__indexed_dataset.rows = self.__dataset
+            self.__indexed_dataset.extend(added)
+        return added
+
+    def indexed_dataset(self) -> Mapping[int, List]:
         """
         Retrieve the dataset indexed by sorting position, starting at 0.
 
+        Rows can be removed with del (or delete) and brought back with
+        restore without shifting the index of any other row.
+
         Returns:
-            Dict[int, List]: The indexed dataset.
+            Mapping[int, List]: The indexed dataset.
         """
         if self.__indexed_dataset is None:
-            dataset = self.dataset()
-            truncated_dataset = dataset[:1000]
-            self.__indexed_dataset = {
-                i: dataset[i] for i in range(len(dataset))
-            }
+            self.__indexed_dataset = LiveIndex(self.dataset())
         return self.__indexed_dataset
 
     def get_hyper_index(self, index: int = None, page_size: int = 10) -> Dict:
@@ -64,19 +108,9 @@ class Server:
         """
         data = self.indexed_dataset()
         assert index is not None and index >= 0 and index <= len(data)
-        page_data = []
-        count = 0
-        next_index = None
-        start = index if index else 0
-
-        for i, item in data.items():
-            if i >= start and count < page_size:
-                page_data.append(item)
-                count += 1
-                continue
-            if count == page_size:
-                next_index = i
-                break
+        assert isinstance(page_size, int) and page_size >= 0
+        indexes, next_index = data.page(index, page_size)
+        page_data = [data[i] for i in indexes]
 
         return {
             "index": index,
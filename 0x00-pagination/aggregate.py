@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Aggregation Queries
+
+This module defines a Table class holding the dataset as NumPy columns
+and answering group-by / sum / rank queries with vectorized operations,
+such as the total count per first name or the top names per ethnicity
+per year.
+
+NumPy is only needed by this module, which the Server imports the first
+time an aggregation is asked for.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from columnar_store import ColumnarStore, is_integer
+
+
+def fold_case(codes: np.ndarray,
+              values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge the values of a text column that only differ by case.
+
+    Parameters:
+        - codes (np.ndarray): The code of every row.
+        - values (np.ndarray): The distinct values the codes refer to.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The codes and values of the merged
+        column, every value spelt as in the first row that has it.
+    """
+    folded = np.array([value.casefold() for value in values], dtype=object)
+    keys, merged = np.unique(folded, return_inverse=True)
+    folded_codes = merged[codes]
+    present, first = np.unique(folded_codes, return_index=True)
+    spellings = np.empty(len(keys), dtype=object)
+    spellings[present] = values[codes[first]]
+    return folded_codes, spellings
+
+
+class Table:
+    """
+    The dataset as factorized NumPy columns.
+
+    Every column has codes (an integer array, one entry per row) and
+    values (the distinct values, so that values[codes] is the column).
+    Text values differing only by case, such as "Ethan" and "ETHAN",
+    share a code.
+    Integer columns also keep their numbers for sums.
+    """
+
+    def __init__(self, rows: Sequence[List], header: List[str]):
+        """
+        Convert the dataset to columns.
+
+        A ColumnarStore is converted without materialising its rows.
+
+        Parameters:
+            - rows (Sequence[List]): The dataset rows.
+            - header (List[str]): The column names.
+        """
+        self.header = header
+        self.codes: Dict[str, np.ndarray] = {}
+        self.values: Dict[str, np.ndarray] = {}
+        self.numbers: Dict[str, np.ndarray] = {}
+        self.lookups: Dict[str, Dict] = {}
+        for position, name in enumerate(header):
+            if isinstance(rows, ColumnarStore):
+                column = rows.columns[position]
+                raw = np.asarray(column.codes)
+                if column.values is not None:
+                    self.codes[name], self.values[name] = fold_case(
+                        raw, np.array(column.values, dtype=object)
+                    )
+                    continue
+            else:
+                cells = [row[position] for row in rows]
+                if not all(is_integer(cell) for cell in cells):
+                    values, codes = np.unique(np.array(cells, dtype=object),
+                                              return_inverse=True)
+                    self.codes[name], self.values[name] = fold_case(codes,
+                                                                    values)
+                    continue
+                raw = np.array([int(cell) for cell in cells], dtype=np.int64)
+            self.numbers[name] = raw.astype(np.int64)
+            values, codes = np.unique(raw, return_inverse=True)
+            self.codes[name] = codes
+            self.values[name] = values.astype(str).astype(object)
+
+    def lookup(self, name: str) -> Dict:
+        """
+        Return the code of every value of a column.
+
+        Integer columns are keyed by number, text columns by case-folded
+        value.
+
+        Parameters:
+            - name (str): The column name.
+
+        Returns:
+            Dict: The code of each value.
+        """
+        if name not in self.lookups:
+            values = self.values[name].tolist()
+            if name in self.numbers:
+                keys = [int(value) for value in values]
+            else:
+                keys = [value.casefold() for value in values]
+            self.lookups[name] = dict(zip(keys, range(len(keys))))
+        return self.lookups[name]
+
+    def extend(self, rows: Sequence[List]) -> bool:
+        """
+        Append rows, coding their values with the existing codes.
+
+        New values get the next codes, so only the new rows are looked
+        at, the existing columns being copied once by np.concatenate.
+
+        Parameters:
+            - rows (Sequence[List]): The new rows.
+
+        Returns:
+            bool: False if an integer column got another value, and the
+            table has to be built again.
+        """
+        columns = [[row[position] for row in rows]
+                   for position in range(len(self.header))]
+        for name, cells in zip(self.header, columns):
+            if name in self.numbers and not all(map(is_integer, cells)):
+                return False
+
+        for name, cells in zip(self.header, columns):
+            lookup = self.lookup(name)
+            if name in self.numbers:
+                numbers = [int(cell) for cell in cells]
+                keys, spellings = numbers, [str(n) for n in numbers]
+                self.numbers[name] = np.concatenate([
+                    self.numbers[name], np.array(numbers, dtype=np.int64)
+                ])
+            else:
+                keys = [cell.casefold() for cell in cells]
+                spellings = cells
+            added = []
+            codes = []
+            for key, spelling in zip(keys, spellings):
+                code = lookup.get(key)
+                if code is None:
+                    code = lookup[key] = len(self.values[name]) + len(added)
+                    added.append(spelling)
+                codes.append(code)
+            self.codes[name] = np.concatenate([
+                self.codes[name], np.array(codes, dtype=np.intp)
+            ])
+            if added:
+                self.values[name] = np.concatenate([
+                    self.values[name], np.array(added, dtype=object)
+                ])
+        return True
+
+    def group_sum(self, group_by: List[str], value: str = "Count",
+                  partition_by: List[str] = None,
+                  top: int = None) -> List[List]:
+        """
+        Sum a column per group and rank the groups.
+
+        Parameters:
+            - group_by (List[str]): The columns identifying a group.
+            - value (str): The integer column to sum.
+            - partition_by (List[str]): Columns among group_by to rank
+            within, None to rank all groups together.
+            - top (int): Keep only this many groups per partition.
+
+        Returns:
+            List[List]: One row per group: the group_by values, the sum
+            and the rank (1 for the largest sum in its partition), by
+            partition then largest sum first.
+        """
+        assert group_by and value in self.numbers
+        partition_by = partition_by or []
+        assert all(column in group_by for column in partition_by)
+
+        dims = [len(self.values[column]) for column in group_by]
+        combined = np.ravel_multi_index(
+            [self.codes[column] for column in group_by], dims
+        )
+        groups, inverse = np.unique(combined, return_inverse=True)
+        sums = np.bincount(inverse, weights=self.numbers[value],
+                           minlength=len(groups)).astype(np.int64)
+        group_codes = dict(zip(group_by, np.unravel_index(groups, dims)))
+
+        partition = np.zeros(len(groups), dtype=np.int64)
+        if partition_by:
+            partition = np.ravel_multi_index(
+                [group_codes[column] for column in partition_by],
+                [len(self.values[column]) for column in partition_by],
+            )
+        order = np.lexsort((groups, -sums, partition))
+        partition = partition[order]
+        starts = np.flatnonzero(np.r_[True, partition[1:] != partition[:-1]])
+        lengths = np.diff(np.r_[starts, len(order)])
+        ranks = np.arange(len(order)) - np.repeat(starts, lengths) + 1
+        if top is not None:
+            order, ranks = order[ranks <= top], ranks[ranks <= top]
+
+        columns = [
+            self.values[column][group_codes[column][order]].tolist()
+            for column in group_by
+        ]
+        return [
+            [*cells, total, rank]
+            for *cells, total, rank in zip(
+                *columns, sums[order].tolist(), ranks.tolist()
+            )
+        ]
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Pagination Benchmarks
+
+This script measures the pagination Server classes: cold and warm start
+time and peak memory of every storage, and per-call latency percentiles of
+index_range, get_page, get_hyper (plain and filtered) and
+get_hyper_index for the first, middle and last pages, with and without
+random deletions.
+
+It runs on the bundled CSV file by default, or on a synthetic CSV file
+of any size generated from the value distributions of the bundled one:
+
+    ./bench_pagination.py
+    ./bench_pagination.py --rows 1000000 --storages mmap snapshot
+    ./bench_pagination.py --generate big.csv --rows 10000000
+"""
+
+import argparse
+import csv
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+index_range = __import__('0-simple_helper_function').index_range
+HyperServer = __import__('2-hypermedia_pagination').Server
+DelServer = __import__('3-hypermedia_del_pagination').Server
+STORAGES = __import__('storage').STORAGES
+shared_dataset = __import__('shared_dataset')
+snapshot = __import__('snapshot')
+
+DATA_FILE = os.path.join(ROOT, HyperServer.DATA_FILE)
+PERCENTILES = (50, 90, 99)
+
+
+def generate(path: str, rows: int, seed: int = 0) -> None:
+    """
+    Write a synthetic CSV file shaped like the bundled dataset.
+
+    Every column is sampled independently from the values of the
+    bundled file, rows are written as they are generated.
+
+    Parameters:
+        - path (str): The path of the CSV file to write.
+        - rows (int): The number of data rows.
+        - seed (int): The random seed, for reproducible files.
+    """
+    with open(DATA_FILE) as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        columns = list(zip(*reader))
+    rng = random.Random(seed)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(header)
+        for _ in range(rows):
+            writer.writerow([rng.choice(column) for column in columns])
+
+
+def percentiles(samples: List[float]) -> Dict[int, float]:
+    """Return the latency percentiles of samples, in microseconds."""
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {p: cuts[p - 1] * 1e6 for p in PERCENTILES}
+
+
+def measure(call: Callable, repeat: int) -> Dict[int, float]:
+    """Time repeated calls and return their latency percentiles."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    return percentiles(samples)
+
+
+def report(name: str, result: Dict[int, float]) -> None:
+    """Print one line of latency percentiles."""
+    cells = "  ".join(
+        "p{}={:>10.1f}us".format(p, result[p]) for p in PERCENTILES
+    )
+    print("  {:<40} {}".format(name, cells))
+
+
+def clean(path: str) -> None:
+    """
+    Remove what a previous load of a CSV file left behind, so that the
+    next load is cold: the offset index, the snapshot and any shared
+    memory segment.
+    """
+    for artifact in (path + ".idx", snapshot.snapshot_path(path)):
+        try:
+            os.remove(artifact)
+        except FileNotFoundError:
+            pass
+    try:
+        segment = shared_dataset.open_segment(
+            shared_dataset.segment_name(path)
+        )
+    except FileNotFoundError:
+        return
+    segment.unlink()
+    segment.close()
+
+
+def first_page(path: str, storage: str) -> Tuple[HyperServer, float]:
+    """Load a new server and return it with its time to the first page."""
+    server = HyperServer(storage)
+    server.DATA_FILE = path
+    start = time.perf_counter()
+    server.get_page(1, 10)
+    return server, time.perf_counter() - start
+
+
+def release(server: HyperServer) -> None:
+    """Unlink the shared memory segment a server published, if any."""
+    segment = getattr(server.dataset(), "segment", None)
+    if segment is not None:
+        segment.unlink()
+
+
+def cold_start(path: str, storage: str) -> None:
+    """
+    Measure the time to the first page, cold and warm, and the peak
+    traced memory of a cold start.
+
+    Cold loads start without the offset index, snapshot or shared
+    segment of the file, warm loads reuse the ones the cold load left.
+
+    Memory-mapped storages are mostly page cache, which tracemalloc
+    does not see: their peak is the Python heap only.
+    """
+    clean(path)
+    server, cold = first_page(path, storage)
+    _, warm = first_page(path, storage)
+    release(server)
+
+    clean(path)
+    tracemalloc.start()
+    server, _ = first_page(path, storage)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    release(server)
+    print("  {:<10} first page cold {:>9.1f}ms   warm {:>9.1f}ms   "
+          "peak heap {:>9.1f}MB".format(
+              storage, cold * 1e3, warm * 1e3, peak / 2 ** 20
+          ))
+
+
+def pages(rows: int, page_size: int) -> Dict[str, int]:
+    """Return the first, middle and last page numbers."""
+    last = max(1, -(-rows // page_size))
+    return {"first": 1, "middle": max(1, last // 2), "last": last}
+
+
+def bench_hyper(path: str, storage: str, page_sizes: List[int],
+                repeat: int) -> None:
+    """Measure get_page and get_hyper, plain and filtered."""
+    server = HyperServer(storage)
+    server.DATA_FILE = path
+    rows = len(server.dataset())
+    filters = {"Gender": "FEMALE", "Ethnicity": "HISPANIC"}
+    filtered = len(server.filter_rows(filters))
+    for page_size in page_sizes:
+        for where, page in pages(rows, page_size).items():
+            report("index_range {} x{}".format(where, page_size),
+                   measure(lambda: index_range(page, page_size), repeat))
+            report("get_page {} x{}".format(where, page_size),
+                   measure(lambda: server.get_page(page, page_size),
+                           repeat))
+            report("get_hyper {} x{}".format(where, page_size),
+                   measure(lambda: server.get_hyper(page, page_size),
+                           repeat))
+        for where, page in pages(filtered, page_size).items():
+            report("get_hyper filtered {} x{}".format(where, page_size),
+                   measure(lambda: server.get_hyper(page, page_size,
+                                                    filters), repeat))
+    release(server)
+
+
+def bench_hyper_index(path: str, storage: str, page_sizes: List[int],
+                      repeat: int, deletions: float, seed: int) -> None:
+    """Measure get_hyper_index, before and after random deletions."""
+    server = DelServer(storage)
+    server.DATA_FILE = path
+    index = server.indexed_dataset()
+    rows = len(index)
+    for label in ("", " deleted"):
+        if label:
+            rng = random.Random(seed)
+            for row in rng.sample(range(rows), int(rows * deletions)):
+                index.delete(row)
+        for page_size in page_sizes:
+            starts = {"first": 0, "middle": len(index) // 2,
+                      "last": max(0, len(index) - page_size)}
+            for where, start in starts.items():
+                report("get_hyper_index{} {} x{}".format(label, where,
+                                                         page_size),
+                       measure(lambda: server.get_hyper_index(start,
+                                                              page_size),
+                               repeat))
+    release(server)
+
+
+def main() -> None:
+    """Parse the command line and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int,
+                        help="benchmark a synthetic CSV of this many rows")
+    parser.add_argument("--generate", metavar="PATH",
+                        help="only write the synthetic CSV to PATH")
+    parser.add_argument("--storages", nargs="+", default=["list"],
+                        choices=sorted(STORAGES))
+    parser.add_argument("--page-sizes", nargs="+", type=int,
+                        default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=200,
+                        help="calls per latency measurement")
+    parser.add_argument("--deletions", type=float, default=0.1,
+                        help="fraction of rows deleted at random")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.generate:
+        generate(args.generate, args.rows or 1000000, args.seed)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = DATA_FILE
+        if args.rows:
+            path = os.path.join(directory, "synthetic.csv")
+            start = time.perf_counter()
+            generate(path, args.rows, args.seed)
+            print("generated {} rows in {:.1f}s".format(
+                args.rows, time.perf_counter() - start))
+
+        print("cold start")
+        for storage in args.storages:
+            cold_start(path, storage)
+        for storage in args.storages:
+            print("latency ({})".format(storage))
+            bench_hyper(path, storage, args.page_sizes, args.repeat)
+            bench_hyper_index(path, storage, args.page_sizes, args.repeat,
+                              args.deletions, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Columnar Dataset Storage
+
+This module defines a ColumnarStore class that keeps a CSV dataset as
+typed columns instead of one list of strings per row. Integer columns
+are packed into arrays and every other column is dictionary-encoded as
+small integer codes. Rows are only materialised when they are read.
+"""
+
+import csv
+from array import array
+from itertools import chain
+from typing import Dict, List, Optional, Sequence
+
+import parallel_loader
+
+TYPECODES = ("B", "H", "I", "Q")
+
+
+def smallest_typecode(largest: int) -> str:
+    """
+    Pick the smallest unsigned array typecode able to hold a value.
+
+    Parameters:
+        - largest (int): The largest value to store.
+
+    Returns:
+        str: The array typecode.
+    """
+    for typecode in TYPECODES:
+        if largest < 1 << (8 * array(typecode).itemsize):
+            return typecode
+    raise OverflowError("value too large for an array column")
+
+
+def is_integer(value: str) -> bool:
+    """Return True if an unsigned integer round-trips through value."""
+    return value.isascii() and value.isdigit() and str(int(value)) == value
+
+
+class Column:
+    """
+    A single column of the dataset.
+
+    Integer columns keep the values themselves in codes and have no
+    dictionary, categorical columns keep an index into values.
+    """
+
+    def __init__(self, name: str, codes: Sequence[int],
+                 values: Optional[List[str]] = None):
+        """
+        Initialize a column.
+
+        Parameters:
+            - name (str): The column name from the CSV header.
+            - codes (Sequence[int]): The packed integers or codes.
+            - values (List[str]): The dictionary of a categorical column,
+            None for an integer column.
+        """
+        self.name = name
+        self.codes = codes
+        self.values = values
+        self.lookup: Optional[Dict[str, int]] = None
+
+    @property
+    def numeric(self) -> bool:
+        """Return True if the column holds integers."""
+        return self.values is None
+
+    def __getitem__(self, index: int) -> str:
+        """Return the value of a row as it appears in the CSV file."""
+        if self.values is None:
+            return str(self.codes[index])
+        return self.values[self.codes[index]]
+
+    def extend(self, cells: List[str]) -> "Column":
+        """
+        Append values, in place while they fit the column.
+
+        Codes of a read-only view (a snapshot column) are copied into an
+        array once. A new column is built aside if the codes need a wider
+        typecode, or if an integer column receives another value.
+
+        Parameters:
+            - cells (List[str]): The new values.
+
+        Returns:
+            Column: The column holding the values, self unless it had to
+            be rebuilt.
+        """
+        if not isinstance(self.codes, array):
+            codes = array(self.codes.format)
+            codes.frombytes(self.codes.cast("B"))
+            self.codes = codes
+        if self.values is None:
+            if not all(is_integer(cell) and int(cell) < 1 << 64
+                       for cell in cells):
+                builder = ColumnBuilder.resume(self)
+                for cell in cells:
+                    builder.append(cell)
+                return builder.build()
+            codes = [int(cell) for cell in cells]
+        else:
+            if self.lookup is None:
+                self.lookup = {
+                    value: code for code, value in enumerate(self.values)
+                }
+            codes = []
+            for cell in cells:
+                code = self.lookup.get(cell)
+                if code is None:
+                    code = self.lookup[cell] = len(self.values)
+                    self.values.append(cell)
+                codes.append(code)
+        typecode = smallest_typecode(max(codes, default=0))
+        if TYPECODES.index(typecode) <= TYPECODES.index(self.codes.typecode):
+            self.codes.extend(codes)
+            return self
+        column = Column(self.name, array(typecode, self.codes), self.values)
+        column.codes.extend(codes)
+        column.lookup = self.lookup
+        return column
+
+
+class ColumnBuilder:
+    """Accumulate the values of a column while the CSV file is read."""
+
+    def __init__(self, name: str):
+        """Initialize an empty column, assumed to be numeric."""
+        self.name = name
+        self.codes = array("Q")
+        self.values = None
+        self.lookup: Dict[str, int] = {}
+
+    def categorize(self) -> None:
+        """Switch to dictionary encoding, re-encoding the values so far."""
+        numbers = self.codes
+        self.codes = array("Q")
+        self.values = []
+        for number in numbers:
+            self.encode(str(number))
+
+    def encode(self, value: str) -> None:
+        """Append a value to a categorical column."""
+        code = self.lookup.get(value)
+        if code is None:
+            code = self.lookup[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def append(self, value: str) -> None:
+        """Append a value, falling back to dictionary encoding if needed."""
+        if self.values is None:
+            if is_integer(value) and int(value) < 1 << 64:
+                self.codes.append(int(value))
+                return
+            self.categorize()
+        self.encode(value)
+
+    @classmethod
+    def resume(cls, column: Column) -> "ColumnBuilder":
+        """Start a builder holding the values of an existing column."""
+        builder = cls(column.name)
+        builder.codes = array("Q", column.codes)
+        if column.values is not None:
+            builder.values = list(column.values)
+            builder.lookup = {
+                value: code for code, value in enumerate(column.values)
+            }
+        return builder
+
+    def build(self) -> Column:
+        """Pack the column into the smallest fitting array."""
+        largest = max(self.codes, default=0)
+        codes = array(smallest_typecode(largest), self.codes)
+        return Column(self.name, codes, self.values)
+
+
+class ColumnarStore(Sequence):
+    """
+    Read-only sequence of rows stored column by column.
+
+    Indexing returns rows in the same shape as the default storage:
+    a list of strings per row.
+    """
+
+    def __init__(self, header: List[str], columns: List[Column]):
+        """
+        Initialize the store.
+
+        Parameters:
+            - header (List[str]): The column names.
+            - columns (List[Column]): One column per header name.
+        """
+        self.header = header
+        self.columns = columns
+        self.__length = len(columns[0].codes) if columns else 0
+
+    @classmethod
+    def from_rows(cls, header: List[str],
+                  rows: Sequence[List]) -> "ColumnarStore":
+        """
+        Build a store from parsed rows.
+
+        Short rows are padded with empty strings to the header width.
+
+        Parameters:
+            - header (List[str]): The column names.
+            - rows (Sequence[List]): The data rows.
+
+        Returns:
+            ColumnarStore: The packed dataset.
+        """
+        builders = [ColumnBuilder(name) for name in header]
+        for row in rows:
+            for i, builder in enumerate(builders):
+                builder.append(row[i] if i < len(row) else "")
+        return cls(header, [builder.build() for builder in builders])
+
+    @classmethod
+    def open(cls, path: str, workers: int = None) -> "ColumnarStore":
+        """
+        Build a store from the complete records of a CSV file without
+        keeping its rows around.
+
+        Parameters:
+            - path (str): The path of the CSV file.
+            - workers (int): Parse the file in this many processes,
+            None to parse it in this process.
+
+        Returns:
+            ColumnarStore: The packed dataset.
+        """
+        end = parallel_loader.data_end(path)
+        reader = csv.reader(parallel_loader.iter_lines(path, end))
+        header = next(reader)
+        if not workers or workers < 2:
+            return cls.from_rows(header, reader)
+        chunks = parallel_loader.iter_chunks(path, workers)
+        return cls.from_rows(header, chain.from_iterable(chunks))
+
+    def extend(self, rows: Sequence[List]) -> None:
+        """
+        Append rows, widening or dictionary-encoding columns as needed.
+
+        Codes are appended in place, a column is only rebuilt aside and
+        swapped in when it has to be widened, and the length is updated
+        last, so readers keep seeing a consistent store.
+
+        Parameters:
+            - rows (Sequence[List]): The new rows.
+        """
+        for position, column in enumerate(self.columns):
+            self.columns[position] = column.extend([
+                row[position] if position < len(row) else "" for row in rows
+            ])
+        self.__length += len(rows)
+
+    def column(self, name: str) -> Column:
+        """Return a column by its header name."""
+        return self.columns[self.header.index(name)]
+
+    def row(self, index: int) -> List[str]:
+        """Materialise a single row."""
+        return [column[index] for column in self.columns]
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self.__length
+
+    def __getitem__(self, index):
+        """Return a row, or a list of rows for a slice."""
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("row index out of range")
+        return self.row(index)
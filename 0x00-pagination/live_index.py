@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Deletion-resilient Row Index
+
+This module defines a LiveIndex class that keeps track of which rows of
+a dataset are still live. It is backed by a Fenwick (binary indexed)
+tree over the live flags, so deleting or restoring a row and finding
+the next page of live rows both run in logarithmic time.
+"""
+
+from array import array
+from collections.abc import Mapping
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+
+class LiveIndex(Mapping):
+    """
+    Mapping of row index to row, restricted to the rows still live.
+
+    Deleted rows keep their index, so indexes handed out to clients
+    stay valid across deletions.
+    """
+
+    def __init__(self, rows: Sequence[List]):
+        """
+        Initialize the index with every row live.
+
+        Parameters:
+            - rows (Sequence[List]): The dataset rows.
+        """
+        self.rows = rows
+        size = len(rows)
+        self.__live = bytearray(b"\x01") * size
+        self.__count = size
+        self.__tree = array("I", [0]) * (size + 1)
+        for i in range(1, size + 1):
+            self.__tree[i] += 1
+            parent = i + (i & -i)
+            if parent <= size:
+                self.__tree[parent] += self.__tree[i]
+
+    def extend(self, count: int) -> None:
+        """
+        Add live rows at the end, after rows were appended to the dataset.
+
+        Every new tree node covers a range ending at the new row, whose
+        sum is read from the nodes already built, so growing by k rows
+        costs O(k log n) and keeps every existing index valid.
+
+        Parameters:
+            - count (int): The number of rows appended.
+        """
+        for _ in range(count):
+            i = len(self.__live) + 1
+            covered = self.rank(i - 1) - self.rank(i - (i & -i))
+            self.__tree.append(covered + 1)
+            self.__live.append(1)
+            self.__count += 1
+
+    def __update(self, index: int, delta: int) -> None:
+        """Add delta to the live count of a row."""
+        i = index + 1
+        size = len(self.__live)
+        while i <= size:
+            self.__tree[i] += delta
+            i += i & -i
+
+    def rank(self, index: int) -> int:
+        """
+        Count the live rows before a given index.
+
+        Parameters:
+            - index (int): The row index.
+
+        Returns:
+            int: The number of live rows in [0, index).
+        """
+        total = 0
+        i = min(index, len(self.__live))
+        while i > 0:
+            total += self.__tree[i]
+            i -= i & -i
+        return total
+
+    def select(self, rank: int) -> int:
+        """
+        Find the index of a live row from its rank.
+
+        Parameters:
+            - rank (int): The number of live rows before the wanted one.
+
+        Returns:
+            int: The index of the live row.
+        """
+        if not 0 <= rank < self.__count:
+            raise IndexError("live row rank out of range")
+        size = len(self.__live)
+        position = 0
+        remaining = rank + 1
+        step = 1 << size.bit_length()
+        while step:
+            following = position + step
+            if following <= size and self.__tree[following] < remaining:
+                position = following
+                remaining -= self.__tree[following]
+            step >>= 1
+        return position
+
+    def page(self, index: int,
+             page_size: int) -> Tuple[List[int], Optional[int]]:
+        """
+        Find the next page of live rows at or after an index.
+
+        Parameters:
+            - index (int): The index to start from.
+            - page_size (int): The number of rows in the page.
+
+        Returns:
+            Tuple[List[int], Optional[int]]: The indexes of the page rows
+            and the index of the first live row after them, None if the
+            page reaches the end of the dataset.
+        """
+        first = self.rank(index)
+        last = min(first + page_size, self.__count)
+        indexes = [self.select(rank) for rank in range(first, last)]
+        next_index = self.select(last) if last < self.__count else None
+        return indexes, next_index
+
+    def delete(self, index: int) -> None:
+        """
+        Mark a row as deleted.
+
+        Raises:
+            KeyError: If the row does not exist or is already deleted.
+        """
+        if index not in self:
+            raise KeyError(index)
+        self.__live[index] = 0
+        self.__count -= 1
+        self.__update(index, -1)
+
+    def restore(self, index: int) -> None:
+        """
+        Mark a deleted row as live again.
+
+        Raises:
+            KeyError: If the row does not exist or is not deleted.
+        """
+        if not 0 <= index < len(self.__live) or self.__live[index]:
+            raise KeyError(index)
+        self.__live[index] = 1
+        self.__count += 1
+        self.__update(index, 1)
+
+    def __delitem__(self, index: int) -> None:
+        """Delete a row, like a dict entry."""
+        self.delete(index)
+
+    def __contains__(self, index) -> bool:
+        """Return True if the row exists and is live."""
+        return (isinstance(index, int) and 0 <= index < len(self.__live)
+                and bool(self.__live[index]))
+
+    def __getitem__(self, index: int) -> List:
+        """
+        Return a live row.
+
+        Raises:
+            KeyError: If the row does not exist or is deleted.
+        """
+        if index not in self:
+            raise KeyError(index)
+        return self.rows[index]
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the live row indexes in order."""
+        live = self.__live
+        return (i for i in range(len(live)) if live[i])
+
+    def __len__(self) -> int:
+        """Return the number of live rows."""
+        return self.__count
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Page View
+
+This module defines a PageView class, a read-only window over a run of
+consecutive dataset rows. Handing out views instead of sliced lists
+lets long exports stream pages without copying them.
+"""
+
+from collections.abc import Sequence
+from typing import List
+
+
+class PageView(Sequence):
+    """Rows [start, stop) of a dataset, read through without copying."""
+
+    def __init__(self, rows: Sequence, start: int, stop: int):
+        """
+        Initialize the view, clipped to the end of the dataset.
+
+        Parameters:
+            - rows (Sequence): The dataset rows.
+            - start (int): The index of the first row.
+            - stop (int): The index after the last row.
+        """
+        self.rows = rows
+        self.range = range(start, max(start, min(stop, len(rows))))
+
+    def __len__(self) -> int:
+        """Return the number of rows in the page."""
+        return len(self.range)
+
+    def __getitem__(self, index):
+        """Return a row of the page, or a narrower view for a slice."""
+        if isinstance(index, slice):
+            view = PageView(self.rows, 0, 0)
+            view.range = self.range[index]
+            return view
+        return self.rows[self.range[index]]
+
+    def __iter__(self):
+        """Iterate over the rows of the page."""
+        rows = self.rows
+        return (rows[i] for i in self.range)
+
+    def __eq__(self, other) -> bool:
+        """Compare the rows with any other sequence of rows."""
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self, other)
+        )
+
+    def __repr__(self) -> str:
+        """Show the rows like the list get_page returns."""
+        return repr(self.tolist())
+
+    def tolist(self) -> List[List]:
+        """Copy the rows of the page into a list."""
+        return list(self)
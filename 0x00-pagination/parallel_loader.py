@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Parallel CSV Loader
+
+This module parses a large CSV file in several processes. The file is
+split into byte ranges that end on record boundaries, each range is
+parsed by a worker of a ProcessPoolExecutor, and the chunks of rows are
+reassembled in file order, so the result is identical to a serial
+csv.reader pass.
+"""
+
+import csv
+import io
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Iterator, List, Tuple
+
+ENCODING = "utf-8"
+CHUNKS_PER_WORKER = 4
+BLOCK_SIZE = 1 << 24
+
+
+def record_end(data: mmap.mmap, position: int, in_quotes: bool) -> int:
+    """
+    Find the end of the record containing a position.
+
+    Parameters:
+        - data (mmap): The mapped file.
+        - position (int): A byte offset.
+        - in_quotes (bool): Whether position is inside a quoted field.
+
+    Returns:
+        int: The offset just after the first newline at or after
+        position that is outside quotes, or the file size.
+    """
+    while position < len(data):
+        newline = data.find(b"\n", position)
+        if newline < 0:
+            return len(data)
+        if data[position:newline].count(b'"') % 2:
+            in_quotes = not in_quotes
+        position = newline + 1
+        if not in_quotes:
+            return position
+    return len(data)
+
+
+def records_end(data: mmap.mmap, position: int) -> int:
+    """
+    Find the end of the last complete record after a record boundary.
+
+    A record still being written (no final newline, or an open quoted
+    field) is left out.
+
+    Parameters:
+        - data (mmap): The mapped file.
+        - position (int): A record boundary.
+
+    Returns:
+        int: The offset after the last complete record, position if
+        there is none.
+    """
+    end = position
+    in_quotes = False
+    while True:
+        newline = data.find(b"\n", position)
+        if newline < 0:
+            return end
+        if data[position:newline].count(b'"') % 2:
+            in_quotes = not in_quotes
+        position = newline + 1
+        if not in_quotes:
+            end = position
+
+
+def last_record_end(data: mmap.mmap) -> int:
+    """
+    Find the end of the last complete record of a mapped file.
+
+    The file is scanned backwards from its last newline, and whether a
+    newline is inside a quoted field is decided by the parity of the
+    quote characters before it.
+
+    Parameters:
+        - data (mmap): The mapped file.
+
+    Returns:
+        int: The offset after the last complete record, 0 if there is
+        none.
+    """
+    quotes = sum(data[block:block + BLOCK_SIZE].count(b'"')
+                 for block in range(0, len(data), BLOCK_SIZE))
+    end = len(data)
+    while True:
+        newline = data.rfind(b"\n", 0, end)
+        if newline < 0:
+            return 0
+        quotes -= data[newline + 1:end].count(b'"')
+        if quotes % 2 == 0:
+            return newline + 1
+        end = newline
+
+
+def data_end(path: str) -> int:
+    """
+    Find the end of the complete records of a CSV file.
+
+    A record still being written when the file is loaded is left for
+    read_tail to pick up once it is complete, as if it had been
+    appended later.
+
+    Parameters:
+        - path (str): The path of the CSV file.
+
+    Returns:
+        int: The offset after the last complete record.
+    """
+    if os.path.getsize(path) == 0:
+        return 0
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return last_record_end(data)
+
+
+def iter_lines(path: str, end: int) -> Iterator[str]:
+    """
+    Read the lines of a CSV file up to an offset, for csv.reader.
+
+    Lines are decoded one by one and keep their line endings, as with
+    open(path, encoding=ENCODING, newline="").
+
+    Parameters:
+        - path (str): The path of the CSV file.
+        - end (int): The offset to stop at, usually data_end(path).
+
+    Yields:
+        str: The lines.
+    """
+    with open(path, "rb") as f:
+        remaining = end
+        for line in f:
+            if remaining <= 0:
+                return
+            line = line[:remaining]
+            remaining -= len(line)
+            yield line.decode(ENCODING)
+
+
+def read_tail(path: str, start: int) -> Tuple[List[List], int]:
+    """
+    Parse the complete records appended to a CSV file after an offset.
+
+    Parameters:
+        - path (str): The path of the CSV file.
+        - start (int): A record boundary, usually the previous end.
+
+    Returns:
+        Tuple[List[List], int]: The new rows and the offset after them.
+    """
+    end = tail_end(path, start)
+    return parse_range(path, start, end), end
+
+
+def tail_end(path: str, start: int) -> int:
+    """
+    Find the end of the complete records appended after an offset.
+
+    Parameters:
+        - path (str): The path of the CSV file.
+        - start (int): A record boundary, usually the previous end.
+
+    Returns:
+        int: The offset after the last complete record, start if
+        nothing was appended.
+    """
+    if os.path.getsize(path) <= start:
+        return start
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return records_end(data, start)
+
+
+def split(path: str, chunks: int) -> List[Tuple[int, int]]:
+    """
+    Split the data records of a CSV file into byte ranges.
+
+    Candidate cut points are spread evenly and then moved forward to
+    the next record boundary. Whether a cut point falls inside a quoted
+    field is decided by the parity of the quote characters before it,
+    counted in large blocks.
+
+    Parameters:
+        - path (str): The path of the CSV file.
+        - chunks (int): The wanted number of ranges.
+
+    Returns:
+        List[Tuple[int, int]]: Non-empty (start, end) ranges covering
+        every complete record but the header, in file order.
+    """
+    if os.path.getsize(path) == 0:
+        return []
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            size = last_record_end(data)
+            start = min(record_end(data, 0, False), size)
+            bounds = [start]
+            quotes = data[:start].count(b'"')
+            counted = start
+            for i in range(1, chunks):
+                cut = max(start + (size - start) * i // chunks, bounds[-1])
+                while counted < cut:
+                    block = min(cut, counted + BLOCK_SIZE)
+                    quotes += data[counted:block].count(b'"')
+                    counted = block
+                end = min(record_end(data, cut, bool(quotes % 2)), size)
+                quotes += data[counted:end].count(b'"')
+                counted = end
+                bounds.append(end)
+            bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+
+
+def parse_range(path: str, start: int, end: int) -> List[List]:
+    """
+    Parse the records in a byte range of a CSV file.
+
+    Parameters:
+        - path (str): The path of the CSV file.
+        - start (int): The offset of the first record.
+        - end (int): The offset after the last record.
+
+    Returns:
+        List[List]: The parsed rows.
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode(ENCODING)
+    return list(csv.reader(io.StringIO(text, newline="")))
+
+
+def iter_chunks(path: str, workers: int) -> Iterator[List[List]]:
+    """
+    Parse the data rows of a CSV file in a pool of processes.
+
+    Parameters:
+        - path (str): The path of the CSV file.
+        - workers (int): The number of worker processes.
+
+    Yields:
+        List[List]: Consecutive chunks of rows, in file order.
+    """
+    ranges = split(path, workers * CHUNKS_PER_WORKER)
+    if not ranges:
+        return
+    starts, ends = zip(*ranges)
+    with ProcessPoolExecutor(workers) as pool:
+        yield from pool.map(parse_range, [path] * len(ranges), starts, ends)
+
+
+def read_rows(path: str, workers: int) -> List[List]:
+    """
+    Parse a CSV file into a list of rows, without its header.
+
+    Parameters:
+        - path (str): The path of the CSV file.
+        - workers (int): The number of worker processes.
+
+    Returns:
+        List[List]: The data rows, as a serial parse would return them.
+    """
+    return list(chain.from_iterable(iter_chunks(path, workers)))
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Pre-serialized Page Payloads
+
+This module defines a PayloadCache class keeping the JSON encoding of
+hot get_hyper responses as bytes, optionally gzip-compressed, so that
+serving a hot page over HTTP needs no encoding work at all. Payloads
+are built lazily and evicted least recently used first once they
+exceed a byte budget.
+"""
+
+import gzip
+import json
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+
+class PayloadCache:
+    """Byte-budgeted LRU cache of encoded get_hyper responses."""
+
+    def __init__(self, server, max_bytes: int = 1 << 24,
+                 compresslevel: int = 6):
+        """
+        Initialize an empty cache.
+
+        Parameters:
+            - server: A 2-hypermedia_pagination Server.
+            - max_bytes (int): The total size of the cached payloads.
+            - compresslevel (int): The gzip level of compressed payloads.
+        """
+        self.server = server
+        self.max_bytes = max_bytes
+        self.compresslevel = compresslevel
+        self.size = 0
+        self.payloads: Dict[Tuple, bytes] = OrderedDict()
+
+    def encode(self, page: int, page_size: int) -> bytes:
+        """Encode a get_hyper response as compact UTF-8 JSON."""
+        response = self.server.get_hyper(page, page_size)
+        return json.dumps(response, separators=(",", ":")).encode()
+
+    def get(self, page: int, page_size: int,
+            compressed: bool = False) -> bytes:
+        """
+        Retrieve the encoded get_hyper response of a page.
+
+        Payloads built before the server reloaded or refreshed its
+        dataset are never served, they age out of the cache.
+
+        Parameters:
+            - page (int): The page number (1-indexed).
+            - page_size (int): The number of items per page.
+            - compressed (bool): Return the gzip-compressed payload.
+
+        Returns:
+            bytes: The JSON payload, ready to be written to a socket.
+        """
+        key = (self.server.generation, page, page_size, compressed)
+        payload = self.payloads.get(key)
+        if payload is not None:
+            self.payloads.move_to_end(key)
+            return payload
+
+        if compressed:
+            payload = gzip.compress(self.get(page, page_size),
+                                    self.compresslevel, mtime=0)
+        else:
+            payload = self.encode(page, page_size)
+        if len(payload) <= self.max_bytes:
+            self.payloads[key] = payload
+            self.size += len(payload)
+            while self.size > self.max_bytes:
+                _, evicted = self.payloads.popitem(last=False)
+                self.size -= len(evicted)
+        return payload
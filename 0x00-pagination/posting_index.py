@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Inverted Index Filtering
+
+This module defines a PostingIndex class mapping every value of a
+column to the sorted row indexes holding it, and an intersect function
+combining several of those posting lists into one filtered view.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Sequence
+
+
+def fold(value) -> str:
+    """Normalize a value so that lookups are case-insensitive."""
+    return str(value).casefold()
+
+
+def intersect(postings: List[Sequence[int]]) -> Sequence[int]:
+    """
+    Intersect sorted posting lists.
+
+    The shortest list drives the intersection and every other list is
+    searched with a bisect that only moves forward, so the cost depends
+    on the shortest list rather than on the dataset size.
+
+    Parameters:
+        - postings (List[Sequence[int]]): Sorted row indexes.
+
+    Returns:
+        Sequence[int]: The sorted row indexes present in every list.
+    """
+    postings = sorted(postings, key=len)
+    result = postings[0]
+    for posting in postings[1:]:
+        matches = array("I")
+        low = 0
+        for row in result:
+            low = bisect_left(posting, row, low)
+            if low == len(posting):
+                break
+            if posting[low] == row:
+                matches.append(row)
+        result = matches
+    return result
+
+
+class PostingIndex:
+    """Inverted index of one column: value -> sorted row indexes."""
+
+    def __init__(self, rows: Sequence[List], column: int):
+        """
+        Build the posting lists of a column.
+
+        Parameters:
+            - rows (Sequence[List]): The dataset rows.
+            - column (int): The position of the column in a row.
+        """
+        self.column = column
+        self.postings: Dict[str, array] = {}
+        self.extend(rows, 0)
+
+    def extend(self, rows: Sequence[List], start: int) -> None:
+        """
+        Index the rows from a given index on.
+
+        New rows have larger indexes, so appending keeps every posting
+        list sorted.
+
+        Parameters:
+            - rows (Sequence[List]): The dataset rows.
+            - start (int): The index of the first row not yet indexed.
+        """
+        for i in range(start, len(rows)):
+            value = fold(rows[i][self.column])
+            if value not in self.postings:
+                self.postings[value] = array("I")
+            self.postings[value].append(i)
+
+    def get(self, value) -> Sequence[int]:
+        """
+        Return the rows holding a value, compared case-insensitively.
+
+        Parameters:
+            - value: The value to look up.
+
+        Returns:
+            Sequence[int]: The sorted row indexes, empty if none.
+        """
+        return self.postings.get(fold(value), array("I"))
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Name Autocomplete Index
+
+This module defines a PrefixIndex class over the first names of the
+dataset. Names are deduplicated case-insensitively, their counts are
+summed across rows, and prefix lookups are a pair of bisects over the
+sorted, case-folded names.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Set
+
+
+class PrefixIndex:
+    """Sorted, case-folded name array ranked by total count."""
+
+    SHORT_PREFIX = 2
+
+    def __init__(self, rows: Sequence[List], name_column: int,
+                 count_column: int):
+        """
+        Aggregate the names of the dataset.
+
+        Each name is shown with its most common spelling.
+
+        Parameters:
+            - rows (Sequence[List]): The dataset rows.
+            - name_column (int): The position of the name in a row.
+            - count_column (int): The position of the count in a row.
+        """
+        self.name_column = name_column
+        self.count_column = count_column
+        self.spellings: Dict[str, Dict[str, int]] = {}
+        self.count(rows)
+
+        self.keys = sorted(self.spellings)
+        self.names = [self.spelling(key) for key in self.keys]
+        self.totals = array("Q", (
+            sum(self.spellings[key].values()) for key in self.keys
+        ))
+        self.__ranked: Dict[str, List[int]] = {}
+
+    def count(self, rows: Sequence[List]) -> Set[str]:
+        """
+        Add the counts of rows to the spellings of their names.
+
+        Parameters:
+            - rows (Sequence[List]): The rows to count.
+
+        Returns:
+            Set[str]: The case-folded names of the rows.
+        """
+        keys = set()
+        for row in rows:
+            name = row[self.name_column]
+            key = name.casefold()
+            counts = self.spellings.setdefault(key, {})
+            counts[name] = counts.get(name, 0) + int(row[self.count_column])
+            keys.add(key)
+        return keys
+
+    def spelling(self, key: str) -> str:
+        """Return the most common spelling of a case-folded name."""
+        counts = self.spellings[key]
+        return max(counts, key=counts.get)
+
+    def extend(self, rows: Sequence[List], start: int) -> None:
+        """
+        Add the rows appended to the dataset.
+
+        Only the names of the new rows are updated, new names are
+        inserted at their sorted position.
+
+        Parameters:
+            - rows (Sequence[List]): The dataset rows.
+            - start (int): The index of the first new row.
+        """
+        for key in sorted(self.count(rows[start:])):
+            position = bisect_left(self.keys, key)
+            if position == len(self.keys) or self.keys[position] != key:
+                self.keys.insert(position, key)
+                self.names.insert(position, "")
+                self.totals.insert(position, 0)
+            self.names[position] = self.spelling(key)
+            self.totals[position] = sum(self.spellings[key].values())
+        self.__ranked = {}
+
+    def search(self, prefix: str) -> List[int]:
+        """
+        Find the names starting with a prefix, highest total count first.
+
+        Results for short prefixes, which match the most names, are
+        cached since every keystroke session starts with them.
+
+        Parameters:
+            - prefix (str): The typed prefix, compared case-insensitively.
+
+        Returns:
+            List[int]: Positions into names and totals.
+        """
+        prefix = prefix.casefold()
+        if prefix in self.__ranked:
+            return self.__ranked[prefix]
+
+        low = bisect_left(self.keys, prefix)
+        high = bisect_left(self.keys, prefix + "\U0010ffff", low)
+        ranked = sorted(range(low, high), key=lambda i: -self.totals[i])
+        if len(prefix) <= self.SHORT_PREFIX:
+            self.__ranked[prefix] = ranked
+        return ranked
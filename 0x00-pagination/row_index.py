@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Byte-offset Row Index
+
+This module defines a RowIndex class giving random access to the rows
+of a CSV file. The file is memory-mapped and a compact array of row
+byte offsets is built once and persisted next to it, so only the rows
+that are actually requested ever get parsed.
+"""
+
+import csv
+import io
+import mmap
+import os
+import struct
+from array import array
+from typing import List, Sequence
+
+
+class RowIndex(Sequence):
+    """
+    Read-only sequence of the data rows of a CSV file (header excluded).
+
+    The offsets array holds the byte offset of every row followed by the
+    end offset of the last row, so row i spans offsets[i]:offsets[i + 1].
+    """
+
+    MAGIC = b"RIDX"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHQQ")
+    ENCODING = "utf-8"
+
+    def __init__(self, path: str):
+        """
+        Memory-map a CSV file and load (or build) its row offsets.
+
+        Parameters:
+            - path (str): The path of the CSV file.
+        """
+        self.path = path
+        self.index_path = path + ".idx"
+        stamp = self.signature()
+        self.__file = open(path, "rb")
+        self.__map = mmap.mmap(self.__file.fileno(), 0,
+                               access=mmap.ACCESS_READ)
+        self.offsets = self.load_offsets()
+        if self.offsets is None:
+            self.offsets = self.build_offsets()
+            self.save_offsets(stamp)
+
+    @classmethod
+    def open(cls, path: str, workers: int = None) -> "RowIndex":
+        """
+        Open a CSV file for random access.
+
+        Rows are parsed on demand, so workers is not used.
+        """
+        return cls(path)
+
+    def signature(self) -> tuple:
+        """Return the (size, mtime) pair the persisted index is tied to."""
+        stat = os.stat(self.path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def build_offsets(self, position: int = 0) -> array:
+        """
+        Scan the file once and record the byte offset of every row.
+
+        Quote characters are counted so that newlines inside quoted
+        fields do not start a new row. A last record still being written
+        is left out: its offset ends the array instead.
+
+        Parameters:
+            - position (int): Where to start, 0 to start with the header.
+
+        Returns:
+            array: The row offsets followed by the end offset.
+        """
+        offsets = array("Q")
+        first = position
+        in_quotes = False
+        complete = True
+        header = position == 0
+        self.__map.seek(position)
+        for line in iter(self.__map.readline, b""):
+            if not in_quotes:
+                if header:
+                    header = False
+                else:
+                    offsets.append(position)
+            if line.count(b'"') % 2:
+                in_quotes = not in_quotes
+            position += len(line)
+            complete = not in_quotes and line.endswith(b"\n")
+        self.__map.seek(0)
+        if complete:
+            offsets.append(position)
+        elif not offsets:
+            offsets.append(first)
+        return offsets
+
+    def extend(self, end: int) -> None:
+        """
+        Index the rows appended to the file, up to a record boundary.
+
+        The file is mapped again at its new size. The old map is left to
+        readers still parsing from it. The offsets array grows in place
+        and the persisted index is appended to, so the cost depends on
+        the number of new rows only.
+
+        Parameters:
+            - end (int): The offset after the last complete new row.
+        """
+        start = self.offsets[-1]
+        if end <= start:
+            return
+        stamp = self.signature()
+        self.__map = mmap.mmap(self.__file.fileno(), 0,
+                               access=mmap.ACCESS_READ)
+        count = len(self.offsets)
+        new = self.build_offsets(start)
+        self.offsets.extend(o for o in new[1:] if o <= end)
+        if self.offsets[-1] != end:
+            self.offsets.append(end)
+        self.append_offsets(stamp, count)
+
+    def load_offsets(self):
+        """
+        Load the persisted offsets if they still match the CSV file.
+
+        Returns:
+            array: The row offsets, or None if missing or stale.
+        """
+        try:
+            with open(self.index_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if len(data) < self.HEADER.size:
+            return None
+        magic, version, size, mtime = self.HEADER.unpack_from(data)
+        if (magic, version) != (self.MAGIC, self.VERSION):
+            return None
+        if (size, mtime) != self.signature():
+            return None
+        offsets = array("Q")
+        offsets.frombytes(data[self.HEADER.size:])
+        return offsets
+
+    def save_offsets(self, stamp: tuple) -> None:
+        """
+        Persist the offsets next to the CSV file, if it is writable.
+
+        The offsets are only persisted if they cover the file exactly as
+        it was when stamp was taken, so rows appended while they were
+        built are never hidden from later processes.
+
+        Parameters:
+            - stamp (tuple): The signature of the CSV file, taken before
+            it was mapped.
+        """
+        size, mtime = stamp
+        if size != self.offsets[-1]:
+            return
+        header = self.HEADER.pack(self.MAGIC, self.VERSION, size, mtime)
+        tmp_path = "{}.{}.tmp".format(self.index_path, os.getpid())
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(header)
+                self.offsets.tofile(f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            pass
+
+    def append_offsets(self, stamp: tuple, count: int) -> None:
+        """
+        Append the offsets added by extend to the persisted index.
+
+        The header is stamped last, so until then the index does not
+        match the CSV file and is ignored by other processes. An index
+        that does not hold the first count offsets is saved whole.
+
+        Parameters:
+            - stamp (tuple): The signature of the CSV file, taken before
+            it was mapped again.
+            - count (int): The number of offsets before extend.
+        """
+        size, mtime = stamp
+        if size != self.offsets[-1]:
+            return
+        try:
+            with open(self.index_path, "r+b") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() != self.HEADER.size + count * 8:
+                    raise OSError("index does not match the offsets")
+                f.seek(-8, os.SEEK_END)
+                last = array("Q")
+                last.frombytes(f.read(8))
+                if last[0] != self.offsets[count - 1]:
+                    raise OSError("index does not match the offsets")
+                self.offsets[count:].tofile(f)
+                f.seek(0)
+                f.write(self.HEADER.pack(self.MAGIC, self.VERSION, size,
+                                         mtime))
+        except OSError:
+            self.save_offsets(stamp)
+
+    def parse(self, start: int, stop: int) -> List[List]:
+        """
+        Parse the rows in the range [start, stop).
+
+        Parameters:
+            - start (int): The index of the first row.
+            - stop (int): The index after the last row.
+
+        Returns:
+            List[List]: The parsed rows.
+        """
+        if start >= stop:
+            return []
+        chunk = self.__map[self.offsets[start]:self.offsets[stop]]
+        text = chunk.decode(self.ENCODING)
+        return list(csv.reader(io.StringIO(text, newline="")))
+
+    def close(self) -> None:
+        """Release the memory map and the file handle."""
+        self.__map.close()
+        self.__file.close()
+
+    def __len__(self) -> int:
+        """Return the number of data rows."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        """
+        Return a row, or a list of rows for a slice.
+
+        Only the requested rows are parsed.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self.parse(start, max(start, stop))
+            return [self.parse(i, i + 1)[0]
+                    for i in range(start, stop, step)]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("row index out of range")
+        return self.parse(index, index + 1)[0]
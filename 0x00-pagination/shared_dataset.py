@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Shared-memory Dataset
+
+This module places the packed snapshot of the dataset in a named
+multiprocessing.shared_memory segment, so that every worker process on
+a host pages over one read-only copy instead of holding its own.
+
+A master process can publish the segment before forking its workers
+(and unlink it on shutdown), or the first worker to need it publishes
+it lazily and the others attach.
+"""
+
+import hashlib
+import os
+import time
+from multiprocessing import resource_tracker, shared_memory
+from threading import Lock
+
+import snapshot
+from columnar_store import ColumnarStore
+
+PUBLISH_TIMEOUT = 30
+COUNT_SIZE = 2  # the column count, last field of snapshot.HEADER
+
+tracker_lock = Lock()
+
+
+def segment_name(path: str) -> str:
+    """
+    Name the segment of a CSV file version.
+
+    The name changes with the CSV size and mtime, so workers never
+    attach to the data of an older file.
+
+    Parameters:
+        - path (str): The path of the CSV file.
+
+    Returns:
+        str: A short, portable shared memory name.
+    """
+    size, mtime = snapshot.signature(path)
+    key = "{}:{}:{}".format(os.path.abspath(path), size, mtime)
+    return "bn_" + hashlib.sha1(key.encode()).hexdigest()[:20]
+
+
+def publish(path: str, workers: int = None) -> shared_memory.SharedMemory:
+    """
+    Copy the packed dataset of a CSV file into a new segment.
+
+    The header is written after the columns, its column count and then
+    its magic last, so a worker attaching early sees an incomplete
+    snapshot rather than a corrupt one.
+
+    The caller owns the segment and should unlink it once no new
+    worker needs to attach.
+
+    Parameters:
+        - path (str): The path of the CSV file.
+        - workers (int): Parse the CSV file in this many processes,
+        None to parse it in this process.
+
+    Returns:
+        SharedMemory: The segment.
+
+    Raises:
+        FileExistsError: If the segment was already published.
+    """
+    stamp = snapshot.signature(path)
+    store = snapshot.load(path, workers)
+    data = snapshot.pack(store, *stamp)
+    segment = shared_memory.SharedMemory(segment_name(path), create=True,
+                                         size=len(data))
+    magic = len(snapshot.MAGIC)
+    count = snapshot.HEADER.size - COUNT_SIZE
+    segment.buf[count + COUNT_SIZE:len(data)] = data[count + COUNT_SIZE:]
+    segment.buf[magic:count] = data[magic:count]
+    segment.buf[count:count + COUNT_SIZE] = data[count:count + COUNT_SIZE]
+    segment.buf[:magic] = data[:magic]
+    return segment
+
+
+def open_segment(name: str) -> shared_memory.SharedMemory:
+    """
+    Open an existing segment without taking ownership of it.
+
+    Attaching processes must not register the segment with the
+    resource tracker, which would unlink it when they exit. Before
+    Python 3.13 there is no track flag, so registration is skipped for
+    this segment only while it is opened.
+    """
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        pass
+    with tracker_lock:
+        register = resource_tracker.register
+
+        def register_others(rname: str, rtype: str) -> None:
+            """Register every resource but the segment being opened."""
+            if rtype != "shared_memory" or rname.lstrip("/") != name:
+                register(rname, rtype)
+
+        resource_tracker.register = register_others
+        try:
+            return shared_memory.SharedMemory(name)
+        finally:
+            resource_tracker.register = register
+
+
+def attach(path: str) -> ColumnarStore:
+    """
+    Page over the published dataset of a CSV file, read-only.
+
+    A segment without magic or without columns is still being
+    published, and is read again until it is complete.
+
+    Parameters:
+        - path (str): The path of the CSV file.
+
+    Returns:
+        ColumnarStore: The dataset, its columns are views into the
+        shared segment.
+
+    Raises:
+        FileNotFoundError: If the segment was not published.
+        TimeoutError: If the segment is still being published after
+        PUBLISH_TIMEOUT seconds.
+    """
+    segment = open_segment(segment_name(path))
+    deadline = time.monotonic() + PUBLISH_TIMEOUT
+    store = snapshot.unpack(segment.buf)
+    while store is None or not store.columns:
+        if time.monotonic() > deadline:
+            segment.close()
+            raise TimeoutError("shared dataset was not published in time")
+        time.sleep(0.01)
+        store = snapshot.unpack(segment.buf)
+    store.segment = segment
+    return store
+
+
+def load(path: str, workers: int = None) -> ColumnarStore:
+    """
+    Attach to the dataset of a CSV file, publishing it first if needed.
+
+    A process that publishes the segment owns it: it is unlinked when
+    that process exits, while already attached workers keep their
+    mapping.
+
+    Parameters:
+        - path (str): The path of the CSV file.
+        - workers (int): Parse the CSV file in this many processes
+        if it has to be published, None to parse it in this process.
+
+    Returns:
+        ColumnarStore: The shared dataset.
+    """
+    try:
+        return attach(path)
+    except FileNotFoundError:
+        pass
+    try:
+        segment = publish(path, workers)
+    except FileExistsError:
+        return attach(path)
+    store = snapshot.unpack(segment.buf)
+    store.segment = segment
+    return store
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Dataset Snapshot
+
+This module saves a ColumnarStore to a compact binary snapshot next to
+the CSV file and loads it back with a single memory map, so a fresh
+process does not have to parse the CSV file again. A snapshot is tied
+to the size and modification time of its CSV file and is rebuilt
+automatically as soon as either changes.
+
+Layout (little-endian header, native-endian columns):
+    header: magic, version, byte order, CSV size, CSV mtime, rows, columns
+    per column: descriptor, name, JSON dictionary, padding, packed codes
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import List, Optional
+
+from columnar_store import Column, ColumnarStore
+
+MAGIC = b"BNSN"
+VERSION = 1
+BYTEORDER = b"<" if sys.byteorder == "little" else b">"
+HEADER = struct.Struct("<4sHcQQQH")
+COLUMN = struct.Struct("<HcBQQ")
+ALIGNMENT = 8
+
+
+def snapshot_path(path: str) -> str:
+    """Return the path of the snapshot of a CSV file."""
+    return path + ".snap"
+
+
+def signature(path: str) -> tuple:
+    """Return the (size, mtime) pair identifying a CSV file version."""
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def padding(offset: int) -> int:
+    """Return the number of bytes aligning offset for any array type."""
+    return -offset % ALIGNMENT
+
+
+def pack(store: ColumnarStore, size: int = 0, mtime: int = 0) -> bytes:
+    """
+    Serialize a store.
+
+    Parameters:
+        - store (ColumnarStore): The dataset to serialize.
+        - size (int): The size of the CSV file it was built from.
+        - mtime (int): The modification time of that CSV file, in ns.
+
+    Returns:
+        bytes: The snapshot.
+    """
+    parts = [HEADER.pack(MAGIC, VERSION, BYTEORDER, size, mtime,
+                         len(store), len(store.columns))]
+    offset = HEADER.size
+    for column in store.columns:
+        name = column.name.encode()
+        values = b""
+        if column.values is not None:
+            values = json.dumps(column.values).encode()
+        codes = memoryview(column.codes)
+        head = COLUMN.size + len(name) + len(values)
+        gap = padding(offset + head)
+        parts += [
+            COLUMN.pack(len(name), codes.format.encode(),
+                        column.values is not None, len(values),
+                        codes.nbytes),
+            name, values, b"\0" * gap, codes.cast("B"),
+        ]
+        offset += head + gap + codes.nbytes
+    return b"".join(parts)
+
+
+def unpack(buffer) -> Optional[ColumnarStore]:
+    """
+    Deserialize a snapshot without copying its columns.
+
+    The codes of every column are memoryviews into buffer, which must
+    stay alive (and unchanged) as long as the store is used.
+
+    Parameters:
+        - buffer: Any bytes-like object holding a snapshot.
+
+    Returns:
+        ColumnarStore: The dataset, None if the snapshot is not in
+        this version's format.
+    """
+    view = memoryview(buffer).toreadonly()
+    if len(view) < HEADER.size:
+        return None
+    magic, version, byteorder, _, _, _, count = HEADER.unpack_from(view)
+    if (magic, version, byteorder) != (MAGIC, VERSION, BYTEORDER):
+        return None
+
+    header: List[str] = []
+    columns: List[Column] = []
+    offset = HEADER.size
+    for _ in range(count):
+        name_size, typecode, categorical, values_size, codes_size = (
+            COLUMN.unpack_from(view, offset)
+        )
+        offset += COLUMN.size
+        name = bytes(view[offset:offset + name_size]).decode()
+        offset += name_size
+        values = None
+        if categorical:
+            values = json.loads(bytes(view[offset:offset + values_size]))
+        offset += values_size
+        offset += padding(offset)
+        codes = view[offset:offset + codes_size].cast(typecode.decode())
+        offset += codes_size
+        header.append(name)
+        columns.append(Column(name, codes, values))
+    return ColumnarStore(header, columns)
+
+
+def read_signature(buffer) -> Optional[tuple]:
+    """Return the (size, mtime) stored in a snapshot header."""
+    if len(buffer) < HEADER.size:
+        return None
+    _, _, _, size, mtime, _, _ = HEADER.unpack_from(buffer)
+    return size, mtime
+
+
+def save(store: ColumnarStore, path: str, stamp: tuple) -> None:
+    """
+    Write the snapshot of a CSV file, if its directory is writable.
+
+    Nothing is written if the CSV file changed since stamp was taken,
+    since the store may then miss rows the new signature covers.
+
+    Parameters:
+        - store (ColumnarStore): The dataset parsed from the CSV file.
+        - path (str): The path of the CSV file.
+        - stamp (tuple): The signature of the CSV file, taken before
+        it was parsed.
+    """
+    if signature(path) != stamp:
+        return
+    data = pack(store, *stamp)
+    tmp_path = "{}.{}.tmp".format(snapshot_path(path), os.getpid())
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, snapshot_path(path))
+    except OSError:
+        pass
+
+
+def load(path: str, workers: int = None) -> ColumnarStore:
+    """
+    Load a CSV file through its snapshot.
+
+    The snapshot is memory-mapped when it matches the CSV file,
+    otherwise the CSV file is parsed and a new snapshot is written.
+
+    Parameters:
+        - path (str): The path of the CSV file.
+        - workers (int): Parse the CSV file in this many processes,
+        None to parse it in this process.
+
+    Returns:
+        ColumnarStore: The dataset.
+    """
+    try:
+        with open(snapshot_path(path), "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        buffer = None
+    if buffer is not None:
+        if read_signature(buffer) == signature(path):
+            store = unpack(buffer)
+            if store is not None:
+                return store
+        buffer.close()
+
+    stamp = signature(path)
+    store = ColumnarStore.open(path, workers)
+    save(store, path, stamp)
+    return store
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Keyset Pagination Index
+
+This module defines a SortIndex class holding the rows of a dataset
+sorted by one column, and the opaque cursors used to page through it.
+A page is found with a bisect on the last sort key seen, so it costs
+the same whatever its depth.
+"""
+
+import base64
+import json
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Sequence, Tuple
+
+from columnar_store import is_integer
+
+
+def encode_cursor(order_by: str, key: Tuple) -> str:
+    """
+    Encode the sort key of the last row of a page as an opaque cursor.
+
+    Parameters:
+        - order_by (str): The ordering the cursor belongs to.
+        - key (Tuple): The (value, row index) sort key.
+
+    Returns:
+        str: A URL-safe cursor.
+    """
+    data = json.dumps([order_by, *key], separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode()
+
+
+def decode_cursor(order_by: str, cursor: str) -> Optional[Tuple]:
+    """
+    Decode a cursor made by encode_cursor.
+
+    Parameters:
+        - order_by (str): The ordering the cursor is used with.
+        - cursor (str): The cursor.
+
+    Returns:
+        Optional[Tuple]: The (value, row index) sort key, None if the
+        cursor is malformed, belongs to another ordering, or holds
+        anything but an int or a str value and an int row index.
+    """
+    try:
+        name, value, index = json.loads(base64.urlsafe_b64decode(cursor))
+    except (TypeError, ValueError):
+        return None
+    if name != order_by or type(index) is not int:
+        return None
+    if type(value) not in (int, str):
+        return None
+    return value, index
+
+
+class SortIndex:
+    """
+    Permutation of the dataset rows sorted by one column.
+
+    Ties are broken by row index so that the order is total and stable,
+    which keeps cursors unambiguous.
+    """
+
+    def __init__(self, rows: Sequence[List], column: int):
+        """
+        Sort the rows by a column.
+
+        Integer columns are compared as numbers, others as strings.
+
+        Parameters:
+            - rows (Sequence[List]): The dataset rows.
+            - column (int): The position of the column in a row.
+        """
+        self.column = column
+        values = [row[column] for row in rows]
+        self.numeric = all(is_integer(value) for value in values)
+        if self.numeric:
+            values = [int(value) for value in values]
+        self.values = values
+        self.order = array("I", sorted(range(len(values)), key=self.key))
+
+    def extend(self, rows: Sequence[List], start: int) -> bool:
+        """
+        Merge the rows appended to the dataset into the order.
+
+        The new rows are sorted on their own and each one is placed with
+        a bisect, the old order being copied over in slices between them.
+
+        Parameters:
+            - rows (Sequence[List]): The dataset rows.
+            - start (int): The index of the first new row.
+
+        Returns:
+            bool: False if a new value is not an integer while the column
+            was, and the index has to be built again.
+        """
+        values = [row[self.column] for row in rows[start:]]
+        if self.numeric:
+            if not all(is_integer(value) for value in values):
+                return False
+            values = [int(value) for value in values]
+        self.values.extend(values)
+        order = array("I")
+        position = 0
+        for index in sorted(range(start, len(self.values)), key=self.key):
+            end = bisect_right(self.order, self.key(index), position,
+                               key=self.key)
+            order.extend(self.order[position:end])
+            order.append(index)
+            position = end
+        order.extend(self.order[position:])
+        self.order = order
+        return True
+
+    def key(self, index: int) -> Tuple:
+        """Return the sort key of a row."""
+        return self.values[index], index
+
+    def after(self, key: Optional[Tuple], page_size: int,
+              descending: bool = False) -> Tuple[List[int], bool]:
+        """
+        Find the rows following a sort key.
+
+        Parameters:
+            - key (Tuple): The sort key of the last row seen,
+            None to start from the first row.
+            - page_size (int): The number of rows to return.
+            - descending (bool): Walk the order backwards.
+
+        Returns:
+            Tuple[List[int], bool]: The row indexes of the page and
+            whether more rows follow it.
+        """
+        if descending:
+            end = len(self.order)
+            if key is not None:
+                end = bisect_left(self.order, key, key=self.key)
+            start = max(0, end - page_size)
+            return self.order[start:end][::-1].tolist(), start > 0
+        start = 0
+        if key is not None:
+            start = bisect_right(self.order, key, key=self.key)
+        end = start + page_size
+        return self.order[start:end].tolist(), end < len(self.order)
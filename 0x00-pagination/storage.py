@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Dataset Storage
+
+This module loads the baby names CSV file for the pagination Server
+classes. The default storage parses every row into a list of lists,
+other storages trade that for lower memory and faster startup.
+"""
+
+import csv
+from typing import List, Sequence, Tuple
+
+import parallel_loader
+import shared_dataset
+import snapshot
+from columnar_store import ColumnarStore
+from row_index import RowIndex
+
+
+def read_rows(path: str, workers: int = None) -> List[List]:
+    """
+    Parse the complete records of a CSV file into a list of rows,
+    without its header.
+
+    Parameters:
+        - path (str): The path of the CSV file.
+        - workers (int): Parse the file in this many processes,
+        None to parse it in this process.
+
+    Returns:
+        List[List]: The data rows.
+    """
+    if workers and workers > 1:
+        return parallel_loader.read_rows(path, workers)
+
+    end = parallel_loader.data_end(path)
+    reader = csv.reader(parallel_loader.iter_lines(path, end))
+    dataset = [row for row in reader]
+    return dataset[1:]
+
+
+def read_header(path: str) -> List[str]:
+    """
+    Read the column names of a CSV file.
+
+    Parameters:
+        - path (str): The path of the CSV file.
+
+    Returns:
+        List[str]: The header row.
+    """
+    with open(path, encoding=parallel_loader.ENCODING, newline="") as f:
+        return next(csv.reader(f))
+
+
+STORAGES = {
+    "list": read_rows,
+    "mmap": RowIndex.open,
+    "columnar": ColumnarStore.open,
+    "snapshot": snapshot.load,
+    "shared": shared_dataset.load,
+}
+
+
+def open_dataset(path: str, storage: str = "list",
+                 workers: int = None) -> Sequence[List]:
+    """
+    Load a CSV file with the given storage.
+
+    Parameters:
+        - path (str): The path of the CSV file.
+        - storage (str): One of the STORAGES names:
+            - list: every row parsed up front (the default).
+            - mmap: memory-mapped file with a persisted row offset index,
+            rows are parsed only when a page is returned.
+            - columnar: typed and dictionary-encoded columns,
+            rows are materialised only when a page is returned.
+            - snapshot: columnar, memory-mapped from a binary snapshot
+            kept next to the CSV file and rebuilt when the file changes.
+            - shared: the snapshot in a shared memory segment, one
+            read-only copy for every worker process on the host.
+        - workers (int): Parse the CSV file in this many processes,
+        None to parse it in this process. Row order is the same.
+
+    Returns:
+        Sequence[List]: The data rows, supporting len(), indexing
+        and slicing.
+    """
+    assert storage in STORAGES, "unknown storage: {}".format(storage)
+    return STORAGES[storage](path, workers)
+
+
+def load_dataset(path: str, storage: str = "list",
+                 workers: int = None) -> Tuple[Sequence[List], int]:
+    """
+    Load a CSV file and remember how much of it was loaded.
+
+    The load is retried if the file changes meanwhile, so that the end
+    returned matches the rows. A record still being written is not
+    loaded and the end stops before it, so that extend_dataset picks
+    it up once it is complete.
+
+    Parameters:
+        - path (str): The path of the CSV file.
+        - storage (str): One of the STORAGES names.
+        - workers (int): Parse the CSV file in this many processes,
+        None to parse it in this process.
+
+    Returns:
+        Tuple[Sequence[List], int]: The data rows and the offset after
+        the last of them.
+    """
+    while True:
+        before = snapshot.signature(path)
+        dataset = open_dataset(path, storage, workers)
+        if snapshot.signature(path) == before:
+            return dataset, parallel_loader.data_end(path)
+
+
+def extend_dataset(dataset: Sequence[List], path: str, end: int,
+                   storage: str = "list",
+                   workers: int = None) -> Tuple[Sequence[List], int]:
+    """
+    Add the rows appended to a CSV file since it was loaded.
+
+    Only the new tail of the file is parsed, and every storage grows in
+    place. The columns of the snapshot and shared storages are
+    read-only views, which the first refresh copies out once.
+
+    Parameters:
+        - dataset (Sequence[List]): The rows loaded so far.
+        - path (str): The path of the CSV file.
+        - end (int): The offset the rows were loaded up to.
+        - storage (str): The storage of the dataset.
+        - workers (int): Unused, the tail is parsed in this process.
+
+    Returns:
+        Tuple[Sequence[List], int]: The dataset, the same object, and
+        the new end offset.
+    """
+    if isinstance(dataset, RowIndex):
+        end = parallel_loader.tail_end(path, end)
+        dataset.extend(end)
+        return dataset, end
+
+    rows, end = parallel_loader.read_tail(path, end)
+    if rows:
+        dataset.extend(rows)
+    return dataset, end
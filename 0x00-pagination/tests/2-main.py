@@ -6,7 +6,9 @@ Main file
 import sys
 import os
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
 
 Server = __import__('2-hypermedia_pagination').Server
 
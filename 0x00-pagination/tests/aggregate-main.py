@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+Server = __import__('2-hypermedia_pagination').Server
+
+server = Server()
+
+NAME = "Child's First Name"
+
+res = server.get_aggregate(1, 3, [NAME])
+print(res)
+
+totals = {}
+for row in server.dataset():
+    name = row[3].casefold()
+    totals[name] = totals.get(name, 0) + int(row[4])
+print(res.get('data')[0][1] == max(totals.values()))
+
+groups = ["Ethnicity", "Year of Birth", NAME]
+res = server.get_aggregate(1, 4, groups,
+                           partition_by=["Ethnicity", "Year of Birth"], top=2)
+print(res)
+
+print(server.get_aggregate(1, 2, ["Gender"]))
+print(Server("columnar").get_aggregate(1, 2, ["Gender"]))
+print(server.get_aggregate(1, 2, ["Year of Birth"], value="Rank"))
+
+try:
+    server.get_aggregate(1, 2, ["Gender"], value="Ethnicity")
+except AssertionError:
+    print("AssertionError raised when summing a text column")
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+Server = __import__('2-hypermedia_pagination').Server
+
+server = Server(storage="columnar")
+store = server.dataset()
+print(type(store).__name__)
+print(len(store))
+for column in store.columns:
+    print(column.name, column.codes.typecode, column.numeric,
+          None if column.numeric else len(column.values))
+
+print(server.get_page(1, 3))
+print(server.get_hyper(100, 3) == Server().get_hyper(100, 3))
+print(server.get_hyper(3000, 100))
+print(store[:] == Server().dataset())
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+Server = __import__('3-hypermedia_del_pagination').Server
+
+server = Server()
+index = server.indexed_dataset()
+print(type(index).__name__)
+print(len(index))
+
+# deep page
+print(server.get_hyper_index(19000, 2))
+
+# delete a run of rows, the page skips them
+for i in range(19000, 19005):
+    index.delete(i)
+print(len(index))
+print(server.get_hyper_index(19000, 2))
+
+try:
+    index.delete(19000)
+except KeyError:
+    print("KeyError raised when deleting a deleted row")
+
+# restore brings the row back at the same index
+index.restore(19002)
+print(server.get_hyper_index(19000, 2))
+print(19002 in index, 19003 in index)
+
+# last page has no next index
+print(server.get_hyper_index(19412, 10))
+
+# a negative page size is rejected instead of paging backwards
+try:
+    server.get_hyper_index(19000, -5)
+except AssertionError:
+    print("AssertionError raised when page_size is negative")
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+Server = __import__('2-hypermedia_pagination').Server
+
+server = Server()
+
+pages = server.iter_pages(3)
+print(next(pages))
+print(next(pages) == server.get_page(2, 3))
+
+try:
+    next(server.iter_pages(0))
+except AssertionError:
+    print("AssertionError raised with 0")
+
+print(sum(len(page) for page in server.iter_pages(1000)))
+print([len(page) for page in server.iter_pages(1000, start=19)])
+
+print(server.get_pages([3, 1, 3000], 2))
+print(server.get_pages([100], 3)[0] == server.get_page(100, 3))
+
+try:
+    server.get_pages([1, -2], 2)
+except AssertionError:
+    print("AssertionError raised with negative values")
+
+# streaming works the same over the other storages
+print(all(
+    a == b for a, b in zip(Server(storage="mmap").iter_pages(500),
+                           server.iter_pages(500))
+))
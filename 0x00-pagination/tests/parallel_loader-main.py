@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+import sys
+import os
+import csv
+import tempfile
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+Server = __import__('2-hypermedia_pagination').Server
+parallel_loader = __import__('parallel_loader')
+read_rows = __import__('storage').read_rows
+
+if __name__ == "__main__":
+    rows = parallel_loader.read_rows(Server.DATA_FILE, 4)
+    print(len(rows), rows == read_rows(Server.DATA_FILE))
+
+    server = Server(workers=3)
+    print(server.get_hyper(100, 3) == Server().get_hyper(100, 3))
+    print(Server("columnar", workers=3).dataset()[:] == server.dataset())
+
+    # quoted fields with commas, quotes and newlines stay whole
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "quoted.csv")
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["id", "note"])
+            for i in range(500):
+                writer.writerow([i, 'line one\n"two", three\n' * (i % 3)])
+        rows = parallel_loader.read_rows(path, 4)
+        print(len(rows), rows == read_rows(path))
+        print(len(parallel_loader.split(path, 16)))
+
+        # a CRLF inside a quoted field is kept by both parsers
+        path = os.path.join(directory, "crlf.csv")
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["id", "note"])
+            for i in range(100):
+                writer.writerow([i, "x\r\ny"])
+        rows = parallel_loader.read_rows(path, 4)
+        print(rows[0], rows == read_rows(path))
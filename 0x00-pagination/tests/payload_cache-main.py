@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+import sys
+import os
+import gzip
+import json
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+Server = __import__('2-hypermedia_pagination').Server
+PayloadCache = __import__('payload_cache').PayloadCache
+
+server = Server()
+payloads = PayloadCache(server, max_bytes=2000)
+
+payload = payloads.get(1, 2)
+print(payload)
+print(payloads.get(1, 2) is payload)
+print(json.loads(payload) == server.get_hyper(1, 2))
+
+compressed = payloads.get(1, 2, compressed=True)
+print(gzip.decompress(compressed) == payload)
+print(payloads.get(1, 2, compressed=True) is compressed)
+
+# the byte budget evicts the least recently used payloads
+for page in range(2, 10):
+    payloads.get(page, 2)
+print(payloads.size <= payloads.max_bytes, len(payloads.payloads))
+print(payloads.get(1, 2) is payload)
+
+# a reloaded dataset is encoded again
+payload = payloads.get(9, 2)
+server.reload()
+print(payloads.get(9, 2) is payload, payloads.get(9, 2) == payload)
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+Server = __import__('2-hypermedia_pagination').Server
+
+server = Server()
+
+try:
+    server.get_hyper(1, 2, filters={"Colour": "RED"})
+except AssertionError:
+    print("AssertionError raised with an unknown column")
+
+filters = {"Gender": "FEMALE", "Ethnicity": "HISPANIC", "Year of Birth": 2014}
+res = server.get_hyper(1, 3, filters=filters)
+print(res)
+
+expected = [row for row in server.dataset()
+            if row[:3] == ["2014", "FEMALE", "HISPANIC"]]
+print(len(expected), res.get('total_pages') == -(-len(expected) // 3))
+print(server.get_hyper(2, 3, filters=filters).get('data') == expected[3:6])
+
+# values are compared case-insensitively
+print(server.get_hyper(1, 5, filters={"Child's First Name": "olivia"}))
+print(server.get_hyper(1, 5, filters={"Gender": "OTHER"}))
+
+# only the most recently used filter sets are memoized
+server.FILTER_CACHE_SIZE = 2
+for year in (2011, 2012, 2013, 2012):
+    server.filter_rows({"Year of Birth": year})
+print(list(server._Server__filtered))
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+import sys
+import os
+import timeit
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+Server = __import__('2-hypermedia_pagination').Server
+
+server = Server()
+
+print(server.autocomplete("Ol", 1, 5))
+print(server.autocomplete("oli", 1, 5))
+print(server.autocomplete("OLIVIA"))
+print(server.autocomplete("zzz"))
+print(server.autocomplete("", 2, 3))
+
+try:
+    server.autocomplete("a", 0, 5)
+except AssertionError:
+    print("AssertionError raised with 0")
+
+seconds = timeit.timeit(lambda: server.autocomplete("ma", 3, 10), number=1000)
+print("under a millisecond:", seconds < 1)
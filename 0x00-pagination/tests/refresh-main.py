@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+HyperServer = __import__('2-hypermedia_pagination').Server
+DelServer = __import__('3-hypermedia_del_pagination').Server
+
+NEW_ROWS = [
+    "2017,FEMALE,HISPANIC,Zoe,11,90\n",
+    "2017,MALE,HISPANIC,Zane,10,91\n",
+]
+
+with tempfile.TemporaryDirectory() as directory:
+    for storage in ["list", "mmap", "columnar", "snapshot"]:
+        path = os.path.join(directory, storage + ".csv")
+        shutil.copy(DelServer.DATA_FILE, path)
+
+        server = DelServer(storage)
+        server.DATA_FILE = path
+        index = server.indexed_dataset()
+        del index[19410]
+        res = server.get_hyper_index(19409, 5)
+
+        with open(path, "a") as f:
+            f.write(NEW_ROWS[0])
+            f.write(NEW_ROWS[1][:10])
+        added = server.refresh()
+        with open(path, "a") as f:
+            f.write(NEW_ROWS[1][10:])
+        added += server.refresh()
+
+        print(storage, added, len(server.dataset()), len(index))
+        print(server.get_hyper_index(res.get('next_index'), 5))
+        print(19410 in server.indexed_dataset())
+
+    path = os.path.join(directory, "hyper.csv")
+    shutil.copy(HyperServer.DATA_FILE, path)
+    server = HyperServer()
+    server.DATA_FILE = path
+    filters = {"Year of Birth": "2017"}
+    print(server.get_hyper(1, 5, filters=filters))
+    print(server.autocomplete("zo"))
+    with open(path, "a") as f:
+        f.writelines(NEW_ROWS)
+    print(server.refresh(), server.refresh())
+    print(server.get_hyper(1, 5, filters=filters))
+    print(server.autocomplete("zo"))
+    print(server.get_hyper(9709, 2))
+
+    # a record half written when the file is loaded is read once complete
+    for storage in ["list", "mmap", "columnar"]:
+        path = os.path.join(directory, "partial-" + storage + ".csv")
+        shutil.copy(HyperServer.DATA_FILE, path)
+        with open(path, "a") as f:
+            f.write(NEW_ROWS[0][:10])
+        server = HyperServer(storage)
+        server.DATA_FILE = path
+        size = len(server.dataset())
+        with open(path, "a") as f:
+            f.write(NEW_ROWS[0][10:])
+        print(storage, size, server.refresh(), server.dataset()[-1])
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "0x01-caching")
+))
+
+Server = __import__('2-hypermedia_pagination').Server
+LRUCache = __import__('3-lru_cache').LRUCache
+
+cache = LRUCache(on_evict=lambda key, item: print("evicted", key))
+server = Server(cache=cache)
+
+res = server.get_hyper(1, 2)
+print(res)
+print(server.get_hyper(1, 2) is res)
+print(server.get_hyper(2, 2) is res)
+
+filters = {"Gender": "MALE"}
+res = server.get_hyper(1, 2, filters=filters)
+print(server.get_hyper(1, 2, filters=filters) is res)
+print(server.get_hyper(1, 2, filters={"Gender": "FEMALE"}) is res)
+
+# the cache keeps MAX_ITEMS responses and evicts the least recently used
+server.get_hyper(3, 2)
+server.get_hyper(4, 2)
+
+# reloading the dataset invalidates every cached response
+res = server.get_hyper(1, 2)
+server.reload()
+print(len(cache.cache_data))
+print(server.get_hyper(1, 2) is res)
+print(server.get_hyper(1, 2) == res)
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+Server = __import__('2-hypermedia_pagination').Server
+RowIndex = __import__('row_index').RowIndex
+
+server = Server(storage="mmap")
+print(type(server.dataset()).__name__)
+print(len(server.dataset()))
+print(server.get_page(1, 3))
+print(server.get_page(3000, 100))
+print(server.get_hyper(100, 3))
+
+print(server.get_hyper(100, 3) == Server().get_hyper(100, 3))
+print(os.path.exists(Server.DATA_FILE + ".idx"))
+
+rows = RowIndex(Server.DATA_FILE)
+print(rows[-1])
+print(len(rows.offsets))
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+import sys
+import os
+from multiprocessing import Pool
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+shared_dataset = __import__('shared_dataset')
+SimpleServer = __import__('1-simple_pagination').Server
+HyperServer = __import__('2-hypermedia_pagination').Server
+DelServer = __import__('3-hypermedia_del_pagination').Server
+
+
+def worker(page):
+    """Page over the shared dataset from a worker process."""
+    server = HyperServer(storage="shared")
+    return server.get_hyper(page, 2)
+
+
+if __name__ == "__main__":
+    segment = shared_dataset.publish(HyperServer.DATA_FILE)
+    try:
+        with Pool(3) as pool:
+            pages = pool.map(worker, [1, 100, 9709])
+        print(pages == [HyperServer().get_hyper(p, 2) for p in [1, 100, 9709]])
+
+        print(SimpleServer(storage="shared").get_page(3, 2))
+        print(DelServer(storage="shared").get_hyper_index(3, 2))
+
+        store = HyperServer(storage="shared").dataset()
+        print(store.segment.name == segment.name)
+        try:
+            store.columns[0].codes[0] = 0
+        except TypeError:
+            print("TypeError raised when writing to the shared dataset")
+        del store
+    finally:
+        segment.close()
+        segment.unlink()
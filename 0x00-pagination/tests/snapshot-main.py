@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+Server = __import__('2-hypermedia_pagination').Server
+snapshot = __import__('snapshot')
+
+server = Server(storage="snapshot")
+print(server.get_hyper(100, 3) == Server().get_hyper(100, 3))
+print(os.path.exists(snapshot.snapshot_path(Server.DATA_FILE)))
+
+start = time.perf_counter()
+Server(storage="snapshot").dataset()
+snapshot_time = time.perf_counter() - start
+start = time.perf_counter()
+Server().dataset()
+csv_time = time.perf_counter() - start
+print("snapshot faster than csv:", snapshot_time < csv_time)
+
+# a changed CSV file invalidates the snapshot
+with tempfile.TemporaryDirectory() as directory:
+    path = os.path.join(directory, "names.csv")
+    shutil.copy(Server.DATA_FILE, path)
+    print(len(snapshot.load(path)))
+    with open(path, "a") as f:
+        f.write("2017,FEMALE,HISPANIC,Zoe,11,90\n")
+    store = snapshot.load(path)
+    print(len(store), store[-1])
+    print(type(store.columns[0].codes).__name__)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+Server = __import__('2-hypermedia_pagination').Server
+encode_cursor = __import__('sort_index').encode_cursor
+
+server = Server()
+
+try:
+    server.get_after(None, 3, order_by="Colour")
+except AssertionError:
+    print("AssertionError raised with an unknown column")
+
+try:
+    server.get_after("not-a-cursor", 3)
+except AssertionError:
+    print("AssertionError raised with an invalid cursor")
+
+res = server.get_after(None, 3, order_by="-Count")
+print(res)
+print(server.get_after(res.get('next_cursor'), 3, order_by="-Count"))
+
+try:
+    server.get_after(res.get('next_cursor'), 3, order_by="Count")
+except AssertionError:
+    print("AssertionError raised with a cursor of another order")
+
+for order_by, key in [("Count", (True, 0)), ("Count", ("10", 0)),
+                      ("Child's First Name", ([1], 0)),
+                      ("Child's First Name", ("Olivia", False))]:
+    try:
+        server.get_after(encode_cursor(order_by, key), 3, order_by=order_by)
+    except AssertionError:
+        print("AssertionError raised with a cursor value of another type")
+
+res = server.get_after(None, 2, order_by="Child's First Name")
+print(res.get('data'))
+
+# walking every page visits every row exactly once
+seen = 0
+cursor = None
+while True:
+    res = server.get_after(cursor, 1000, order_by="Rank")
+    seen += res.get('page_size')
+    cursor = res.get('next_cursor')
+    if cursor is None:
+        break
+print(seen == len(server.dataset()))
@@ -15,19 +15,22 @@ class BasicCache(BaseCaching):
     BasicCache class implementing a simple dict-based caching system.
     """
 
-    def put(self, key, item):
+    def put(self, key, item, ttl=None):
         """
         Add an item to the cache.
 
         Args:
             key: The key for the item.
             item: The item to be stored in the cache.
+            ttl: Seconds before the item expires, the cache default
+                when None.
 
         Returns:
             None
         """
+        self.sweep(key)
         if key is not None and item is not None:
-            self.cache_data[key] = item
+            self.store(key, item, 0, ttl)
 
     def get(self, key):
         """
@@ -40,4 +43,5 @@ class BasicCache(BaseCaching):
             The cached item if found,
             or None if the key is not present in the cache.
         """
+        self.sweep(key)
         return self.cache_data.get(key)
@@ -6,9 +6,13 @@ This module defines the FIFOCache class, which extends the BaseCaching class.
 It provides a caching mechanism where items are added to the cache,
 and when the cache reaches its maximum capacity,
 the oldest item is removed to make space for the new item.
+
+Keys are kept in insertion order in a ring buffer, so finding the oldest
+one costs constant time however large the cache is.
 """
 
 from base_caching import BaseCaching
+from ring_buffer import RingBuffer
 
 
 class FIFOCache(BaseCaching):
@@ -16,30 +20,38 @@ class FIFOCache(BaseCaching):
     FIFOCache class implementing a First-In-First-Out based caching system.
     """
 
-    def __init__(self):
+    def __init__(self, **kwargs):
         """
         Initialize class instance.
+
+        Args:
+            kwargs: The capacity (max_items, max_bytes, weigher),
+                expiry (ttl, clock) and instrumentation (on_evict,
+                instrument, sample_every) options of BaseCaching.
         """
-        super().__init__()
+        super().__init__(**kwargs)
+        self.order = RingBuffer(2 * self.max_items)
 
-    def put(self, key, item):
+    def put(self, key, item, ttl=None):
         """
         Add an item to the cache.
 
         Args:
             key: The key for the item.
             item: The item to be stored in the cache.
+            ttl: Seconds before the item expires, the cache default
+                when None.
 
         Returns:
             None
         """
+        self.sweep(key)
         if key and item:
-            self.cache_data[key] = item
-
-        if len(self.cache_data) > BaseCaching.MAX_ITEMS:
-            discarded_key = sorted(self.cache_data)[0]
-            self.cache_data.pop(discarded_key)
-            print(f"DISCARD: {discarded_key}")
+            weight = self.weigh(key, item)
+            if self.make_room(key, weight):
+                if key not in self.order:
+                    self.order.push(key)
+                self.store(key, item, weight, ttl)
 
     def get(self, key):
         """
@@ -52,4 +64,28 @@ class FIFOCache(BaseCaching):
             The cached item if found,
             or None if the key is not present in the cache.
         """
+        self.sweep(key)
         return self.cache_data.get(key)
+
+    def victim(self, key):
+        """
+        Return the key to discard to make room for another key.
+
+        Args:
+            key: The key being stored.
+
+        Returns:
+            The first-in key other than key. Updating an item does not
+            change its place.
+        """
+        return self.order.first(key)
+
+    def remove(self, key):
+        """
+        Remove a key from the cache and from the insertion order.
+
+        Args:
+            key: The cached key.
+        """
+        super().remove(key)
+        self.order.remove(key)
@@ -6,9 +6,17 @@ This module defines the LFUCache class, which extends the BaseCaching class.
 It provides a caching mechanism where items are added to the cache,
 and when the cache reaches its maximum capacity,
 the least frequently used item is removed to make space for the new item.
+
+Keys are kept in frequency buckets, each ordered from least to most
+recently used, and the buckets are chained in a doubly linked list
+sorted by frequency, so every operation runs in constant time.
 """
 
 from base_caching import BaseCaching
+from collections import OrderedDict
+from heapq import merge
+
+HEAD = -1
 
 
 class LFUCache(BaseCaching):
@@ -16,43 +24,55 @@ class LFUCache(BaseCaching):
     LFUCache class implementing a Least Frequently Used based caching system.
     """
 
-    def __init__(self):
+    def __init__(self, aging_period=None, **kwargs):
         """
         Initialize class instance.
+
+        Args:
+            aging_period: Halve every use count after this many accesses,
+                so that keys which were hot a long time ago can still be
+                discarded. None to never age.
+            kwargs: The capacity (max_items, max_bytes, weigher),
+                expiry (ttl, clock) and instrumentation (on_evict,
+                instrument, sample_every) options of BaseCaching.
         """
-        super().__init__()
-        self.keys = []
+        super().__init__(**kwargs)
+        assert aging_period is None or aging_period > 0
+        self.aging_period = aging_period
         self.uses = {}
+        self.buckets = {}
+        self.higher = {HEAD: HEAD}
+        self.lower = {HEAD: HEAD}
+        self.accesses = 0
+        self.last_access = {}
 
-    def put(self, key, item):
+    def put(self, key, item, ttl=None):
         """
         Add an item to the cache.
 
         Args:
             key: The key for the item.
             item: The item to be stored in the cache.
+            ttl: Seconds before the item expires, the cache default
+                when None.
 
         Returns:
             None
         """
+        self.sweep(key)
         if key and item:
-            if (
-                len(self.keys) == BaseCaching.MAX_ITEMS
-                and key not in self.keys
-            ):
-                discarded_key = self.keys.pop(
-                    self.keys.index(self.get_lfu_item()
-                                    ))
-                del self.cache_data[discarded_key]
-                del self.uses[discarded_key]
-                print(f"DISCARD: {discarded_key}")
-            self.cache_data[key] = item
-            if key in self.keys:
-                self.keys.append(self.keys.pop(self.keys.index(key)))
-                self.uses[key] += 1
-            else:
-                self.keys.append(key)
-                self.uses[key] = 0
+            weight = self.weigh(key, item)
+            if key in self.cache_data:
+                self.touch(key)
+                if self.make_room(key, weight):
+                    self.store(key, item, weight, ttl)
+                return
+            if not self.make_room(key, weight):
+                return
+            self.store(key, item, weight, ttl)
+            self.uses[key] = 0
+            self.bucket(0, HEAD)[key] = None
+            self.tick(key)
 
     def get(self, key):
         """
@@ -65,9 +85,9 @@ class LFUCache(BaseCaching):
             The cached item if found,
             or None if the key is not present in the cache.
         """
+        self.sweep(key)
         if key in self.cache_data:
-            self.keys.append(self.keys.pop(self.keys.index(key)))
-            self.uses[key] += 1
+            self.touch(key)
             return self.cache_data[key]
 
     def get_lfu_item(self):
@@ -79,11 +99,119 @@ class LFUCache(BaseCaching):
         Returns:
             The key of the least frequently used item in the cache.
         """
-        items = list(self.uses.items())
-        min_freq = min(self.uses.values())
+        return next(iter(self.buckets[self.higher[HEAD]]))
+
+    def victim(self, key):
+        """
+        Return the key to discard to make room for another key.
+
+        Args:
+            key: The key being stored.
+
+        Returns:
+            The least frequently used key other than key, the least
+            recently used one among equals.
+        """
+        uses = self.higher[HEAD]
+        while uses != HEAD:
+            for victim in self.buckets[uses]:
+                if victim != key:
+                    return victim
+            uses = self.higher[uses]
+
+    def touch(self, key):
+        """
+        Record a use of a cached key, moving it to the next bucket.
+
+        Args:
+            key: The key that was used.
+        """
+        uses = self.uses[key]
+        self.bucket(uses + 1, uses)[key] = None
+        self.uses[key] = uses + 1
+        self.unbucket(key, uses)
+        self.tick(key)
+
+    def remove(self, key):
+        """
+        Remove a key from the cache and from its bucket.
+
+        Args:
+            key: The cached key.
+        """
+        super().remove(key)
+        self.unbucket(key, self.uses.pop(key))
+        del self.last_access[key]
+
+    def bucket(self, uses, lower):
+        """
+        Return the bucket of a use count, linking a new one if needed.
+
+        Args:
+            uses: The use count.
+            lower: The next lower linked count, or HEAD.
+
+        Returns:
+            The keys used that many times.
+        """
+        if uses not in self.buckets:
+            self.buckets[uses] = OrderedDict()
+            higher = self.higher[lower]
+            self.higher[lower] = uses
+            self.lower[higher] = uses
+            self.higher[uses] = higher
+            self.lower[uses] = lower
+        return self.buckets[uses]
+
+    def unbucket(self, key, uses):
+        """
+        Remove a key from its bucket, unlinking the bucket if emptied.
 
-        lfu_keys = [key for key, freq in items if freq == min_freq]
+        Args:
+            key: The key.
+            uses: The use count of the key.
+        """
+        bucket = self.buckets[uses]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[uses]
+            higher = self.higher.pop(uses)
+            lower = self.lower.pop(uses)
+            self.higher[lower] = higher
+            self.lower[higher] = lower
+
+    def tick(self, key):
+        """
+        Count an access, and age the use counts once per period.
+
+        Args:
+            key: The key that was accessed.
+        """
+        self.accesses += 1
+        self.last_access[key] = self.accesses
+        if self.aging_period and self.accesses % self.aging_period == 0:
+            self.age()
 
-        for key in self.keys:
-            if key in lfu_keys:
-                return key
+    def age(self):
+        """
+        Halve every use count.
+
+        Buckets that fall on the same count are merged by last access,
+        so the least recently used tie-break is kept.
+        """
+        halved = {}
+        uses = self.higher[HEAD]
+        while uses != HEAD:
+            halved.setdefault(uses // 2, []).append(self.buckets[uses])
+            uses = self.higher[uses]
+        self.buckets = {}
+        self.higher = {HEAD: HEAD}
+        self.lower = {HEAD: HEAD}
+        lower = HEAD
+        for uses, buckets in halved.items():
+            keys = merge(*buckets, key=self.last_access.__getitem__)
+            bucket = self.bucket(uses, lower)
+            for key in keys:
+                bucket[key] = None
+                self.uses[key] = uses
+            lower = uses
@@ -0,0 +1,157 @@
+#!/usr/bin/python3
+"""
+ARCCache module implementing an Adaptive Replacement Cache (ARC) system.
+
+This module defines the ARCCache class, which extends the BaseCaching class.
+Cached keys are split between T1, the keys used once recently, and T2,
+the keys used at least twice. The keys recently discarded from each list
+are remembered, without their items, in the ghost lists B1 and B2.
+A hit in a ghost list shows which of recency or frequency would have
+kept the key, and moves the target size p of T1 towards it, so the cache
+tunes itself between scans and a stable hot set.
+"""
+
+from base_caching import BaseCaching
+from collections import OrderedDict
+
+
+class ARCCache(BaseCaching):
+    """
+    ARCCache class implementing an Adaptive Replacement based caching system.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize class instance.
+
+        Args:
+            kwargs: The capacity (max_items, max_bytes, weigher),
+                expiry (ttl, clock) and instrumentation (on_evict,
+                instrument, sample_every) options of BaseCaching.
+        """
+        super().__init__(**kwargs)
+        self.t1 = OrderedDict()
+        self.t2 = OrderedDict()
+        self.b1 = OrderedDict()
+        self.b2 = OrderedDict()
+        self.p = 0
+
+    def put(self, key, item, ttl=None):
+        """
+        Add an item to the cache.
+
+        Args:
+            key: The key for the item.
+            item: The item to be stored in the cache.
+            ttl: Seconds before the item expires, the cache default
+                when None.
+
+        Returns:
+            None
+        """
+        self.sweep(key)
+        if key and item:
+            weight = self.weigh(key, item)
+            if key in self.cache_data:
+                self.promote(key)
+            elif key in self.b1:
+                step = max(len(self.b2) // len(self.b1), 1)
+                self.p = min(self.p + step, self.max_items)
+            elif key in self.b2:
+                step = max(len(self.b1) // len(self.b2), 1)
+                self.p = max(self.p - step, 0)
+            if not self.make_room(key, weight):
+                return
+            if key in self.b1 or key in self.b2:
+                self.b1.pop(key, None)
+                self.b2.pop(key, None)
+                self.t2[key] = None
+            elif key not in self.cache_data:
+                self.t1[key] = None
+            self.store(key, item, weight, ttl)
+            self.trim()
+
+    def get(self, key):
+        """
+        Retrieve an item from the cache.
+
+        Args:
+            key: The key associated with the item to retrieve.
+
+        Returns:
+            The cached item if found,
+            or None if the key is not present in the cache.
+        """
+        self.sweep(key)
+        if key in self.cache_data:
+            self.promote(key)
+            return self.cache_data[key]
+
+    def promote(self, key):
+        """
+        Move a cached key to the most recently used end of T2.
+
+        Args:
+            key: The cached key.
+        """
+        if key in self.t1:
+            del self.t1[key]
+            self.t2[key] = None
+        else:
+            self.t2.move_to_end(key)
+
+    def victim(self, key):
+        """
+        Return the key to discard to make room for another key.
+
+        The least recently used key of T1 goes while T1 is larger than
+        its target size p, the least recently used key of T2 otherwise.
+
+        Args:
+            key: The key being stored.
+
+        Returns:
+            The key to discard, other than key.
+        """
+        t1_first = (self.t1 and (len(self.t1) > self.p or
+                                 (key in self.b2 and len(self.t1) == self.p)))
+        lists = (self.t1, self.t2) if t1_first else (self.t2, self.t1)
+        for keys in lists:
+            for victim in keys:
+                if victim != key:
+                    return victim
+
+    def remove(self, key):
+        """
+        Remove a key from the cache and from T1 or T2.
+
+        Args:
+            key: The cached key.
+        """
+        super().remove(key)
+        if key in self.t1:
+            del self.t1[key]
+        else:
+            del self.t2[key]
+
+    def discard(self, key):
+        """
+        Remove a key to make room, and remember it in a ghost list.
+
+        Args:
+            key: The cached key.
+        """
+        ghosts = self.b1 if key in self.t1 else self.b2
+        super().discard(key)
+        ghosts[key] = None
+
+    def trim(self):
+        """
+        Forget the oldest ghost keys, so that T1 and B1 hold at most
+        max_items keys and the four lists at most twice as many.
+        """
+        while len(self.t1) + len(self.b1) > self.max_items:
+            self.b1.popitem(last=False)
+        while (len(self.t1) + len(self.t2) + len(self.b1) + len(self.b2) >
+               2 * self.max_items):
+            self.b2.popitem(last=False)
@@ -0,0 +1,157 @@
+#!/usr/bin/python3
+"""
+TinyLFUCache module implementing a W-TinyLFU based caching system.
+
+This module defines the TinyLFUCache class, which extends the BaseCaching
+class. New keys enter a small window LRU. Keys leaving the window become
+candidates for the main cache, a segmented LRU made of a probation and a
+protected segment, and a candidate only gets in if a count-min sketch
+says it was used more often than the main cache victim it would replace.
+One-hit wonders are thus kept out of the main cache, while the sketch
+needs a few bytes per key instead of a counter per cached key.
+"""
+
+from base_caching import BaseCaching
+from collections import OrderedDict
+from count_min_sketch import CountMinSketch
+
+SKETCH_MIN_WIDTH = 64
+
+
+class TinyLFUCache(BaseCaching):
+    """
+    TinyLFUCache class implementing a W-TinyLFU based caching system.
+    """
+
+    def __init__(self, window_ratio=0.01, protected_ratio=0.8, **kwargs):
+        """
+        Initialize class instance.
+
+        Args:
+            window_ratio: The share of max_items kept by the window LRU,
+                at least one item.
+            protected_ratio: The share of the main cache kept by the
+                protected segment.
+            kwargs: The capacity (max_items, max_bytes, weigher),
+                expiry (ttl, clock) and instrumentation (on_evict,
+                instrument, sample_every) options of BaseCaching.
+        """
+        super().__init__(**kwargs)
+        assert 0 < window_ratio < 1 and 0 < protected_ratio < 1
+        self.window_items = max(1, int(self.max_items * window_ratio))
+        main_items = max(1, self.max_items - self.window_items)
+        self.protected_items = max(1, int(main_items * protected_ratio))
+        self.window = OrderedDict()
+        self.probation = OrderedDict()
+        self.protected = OrderedDict()
+        self.sketch = CountMinSketch(max(self.max_items, SKETCH_MIN_WIDTH))
+
+    def put(self, key, item, ttl=None):
+        """
+        Add an item to the cache.
+
+        Args:
+            key: The key for the item.
+            item: The item to be stored in the cache.
+            ttl: Seconds before the item expires, the cache default
+                when None.
+
+        Returns:
+            None
+        """
+        self.sweep(key)
+        if key and item:
+            self.sketch.increment(key)
+            weight = self.weigh(key, item)
+            if key in self.cache_data:
+                self.touch(key)
+            if not self.make_room(key, weight):
+                return
+            if key not in self.cache_data:
+                self.window[key] = None
+            self.store(key, item, weight, ttl)
+            while len(self.window) > self.window_items:
+                candidate, _ = self.window.popitem(last=False)
+                self.probation[candidate] = None
+
+    def get(self, key):
+        """
+        Retrieve an item from the cache.
+
+        Args:
+            key: The key associated with the item to retrieve.
+
+        Returns:
+            The cached item if found,
+            or None if the key is not present in the cache.
+        """
+        self.sweep(key)
+        self.sketch.increment(key)
+        if key in self.cache_data:
+            self.touch(key)
+            return self.cache_data[key]
+
+    def touch(self, key):
+        """
+        Record a use of a cached key.
+
+        A key used again while on probation moves to the protected
+        segment, whose least recently used key goes back on probation
+        when the segment is full.
+
+        Args:
+            key: The cached key.
+        """
+        if key in self.window:
+            self.window.move_to_end(key)
+        elif key in self.protected:
+            self.protected.move_to_end(key)
+        else:
+            del self.probation[key]
+            self.protected[key] = None
+            if len(self.protected) > self.protected_items:
+                demoted, _ = self.protected.popitem(last=False)
+                self.probation[demoted] = None
+
+    def victim(self, key):
+        """
+        Return the key to discard to make room for another key.
+
+        When the window is full, its least recently used key is the
+        candidate. It is admitted to probation if the sketch estimates
+        it more frequent than the main cache victim, which is then
+        discarded instead of it.
+
+        Args:
+            key: The key being stored.
+
+        Returns:
+            The key to discard, other than key.
+        """
+        candidate = next((k for k in self.window if k != key), None)
+        if candidate is not None and len(self.window) < self.window_items:
+            if self.probation or self.protected:
+                candidate = None
+        victim = next((k for k in self.probation if k != key), None)
+        if victim is None:
+            victim = next((k for k in self.protected if k != key), None)
+        if candidate is None or victim is None:
+            return candidate if victim is None else victim
+        if self.sketch.estimate(candidate) > self.sketch.estimate(victim):
+            del self.window[candidate]
+            self.probation[candidate] = None
+            return victim
+        return candidate
+
+    def remove(self, key):
+        """
+        Remove a key from the cache and from its segment.
+
+        Args:
+            key: The cached key.
+        """
+        super().remove(key)
+        for segment in (self.window, self.probation, self.protected):
+            if key in segment:
+                del segment[key]
+                return
@@ -0,0 +1,325 @@
+#!/usr/bin/python3
+"""
+ClockCache module implementing CLOCK and CLOCK-Pro based caching systems.
+
+This module defines the ClockCache class, which extends the BaseCaching
+class. Keys live in a ring of preallocated slots, each with a reference
+bit. A hit only sets the bit of its slot. To make room, a hand sweeps the
+ring, clearing the bits it passes, and discards the first key whose bit
+was already clear, which approximates LRU without reordering anything on
+the read path.
+
+The ClockProCache class refines it after CLOCK-Pro: keys are hot or
+cold, new keys start cold and on test, and only cold keys are discarded.
+A cold key used again while on test becomes hot, and recently discarded
+cold keys are remembered so that their return grows the share of cold
+slots, adapting to the reuse distance of the workload.
+"""
+
+from base_caching import BaseCaching
+from collections import OrderedDict, deque
+
+
+class ClockCache(BaseCaching):
+    """
+    ClockCache class implementing a CLOCK (second chance) caching system.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize class instance.
+
+        Args:
+            kwargs: The capacity (max_items, max_bytes, weigher),
+                expiry (ttl, clock) and instrumentation (on_evict,
+                instrument, sample_every) options of BaseCaching.
+        """
+        super().__init__(**kwargs)
+        self.keys = [None] * self.max_items
+        self.referenced = bytearray(self.max_items)
+        self.slots = {}
+        self.free = list(range(self.max_items - 1, -1, -1))
+        self.hand = 0
+
+    def put(self, key, item, ttl=None):
+        """
+        Add an item to the cache.
+
+        Args:
+            key: The key for the item.
+            item: The item to be stored in the cache.
+            ttl: Seconds before the item expires, the cache default
+                when None.
+
+        Returns:
+            None
+        """
+        self.sweep(key)
+        if key and item:
+            weight = self.weigh(key, item)
+            if key in self.slots:
+                self.referenced[self.slots[key]] = 1
+            if not self.make_room(key, weight):
+                return
+            if key not in self.slots:
+                self.insert(key, self.free.pop())
+            self.store(key, item, weight, ttl)
+
+    def get(self, key):
+        """
+        Retrieve an item from the cache.
+
+        Args:
+            key: The key associated with the item to retrieve.
+
+        Returns:
+            The cached item if found,
+            or None if the key is not present in the cache.
+        """
+        self.sweep(key)
+        slot = self.slots.get(key)
+        if slot is not None:
+            self.referenced[slot] = 1
+            return self.cache_data[key]
+
+    def insert(self, key, slot):
+        """
+        Put a new key in a free slot, with its reference bit clear.
+
+        Args:
+            key: The key.
+            slot: The free slot.
+        """
+        self.keys[slot] = key
+        self.referenced[slot] = 0
+        self.slots[key] = slot
+
+    def advance(self):
+        """
+        Move the hand to the next slot.
+        """
+        self.hand += 1
+        if self.hand == self.max_items:
+            self.hand = 0
+
+    def victim(self, key):
+        """
+        Return the key to discard to make room for another key.
+
+        The hand gives every referenced key it passes a second chance,
+        and stops on the first unreferenced one.
+
+        Args:
+            key: The key being stored.
+
+        Returns:
+            The key to discard, other than key.
+        """
+        keys = self.keys
+        referenced = self.referenced
+        while True:
+            candidate = keys[self.hand]
+            if candidate is None or candidate == key:
+                pass
+            elif referenced[self.hand]:
+                referenced[self.hand] = 0
+            else:
+                self.advance()
+                return candidate
+            self.advance()
+
+    def remove(self, key):
+        """
+        Remove a key from the cache and free its slot.
+
+        Args:
+            key: The cached key.
+        """
+        super().remove(key)
+        slot = self.slots.pop(key)
+        self.keys[slot] = None
+        self.free.append(slot)
+
+
+class ClockProCache(ClockCache):
+    """
+    ClockProCache class implementing a CLOCK-Pro based caching system.
+
+    The cold and hot hands are queues of slots in clock order, so each
+    hand only passes the keys it acts on. A slot is queued at most once
+    per hand, and entries left by keys that changed status or were
+    removed are skipped when the hand reaches them.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize class instance.
+
+        Args:
+            kwargs: The capacity (max_items, max_bytes, weigher),
+                expiry (ttl, clock) and instrumentation (on_evict,
+                instrument, sample_every) options of BaseCaching.
+        """
+        super().__init__(**kwargs)
+        self.hot = bytearray(self.max_items)
+        self.test = bytearray(self.max_items)
+        self.queued = (bytearray(self.max_items), bytearray(self.max_items))
+        self.hands = (deque(), deque())
+        self.hot_count = 0
+        self.cold_target = 1
+        self.ghosts = OrderedDict()
+
+    def enqueue(self, slot):
+        """
+        Queue a slot on the hand of its status, unless already queued.
+
+        Args:
+            slot: The slot.
+        """
+        hot = self.hot[slot]
+        if not self.queued[hot][slot]:
+            self.queued[hot][slot] = 1
+            self.hands[hot].append(slot)
+
+    def next_slot(self, hot):
+        """
+        Move a hand to the next slot of its status.
+
+        Args:
+            hot: 1 for the hot hand, 0 for the cold hand.
+
+        Returns:
+            The slot, or None if no key has that status.
+        """
+        hand = self.hands[hot]
+        while hand:
+            slot = hand.popleft()
+            self.queued[hot][slot] = 0
+            if self.keys[slot] is not None and self.hot[slot] == hot:
+                return slot
+        return None
+
+    def insert(self, key, slot):
+        """
+        Put a new key in a free slot: hot if it comes back while its
+        test period was running, cold and on test otherwise.
+
+        Args:
+            key: The key.
+            slot: The free slot.
+        """
+        super().insert(key, slot)
+        if key in self.ghosts:
+            del self.ghosts[key]
+            self.cold_target = min(self.cold_target + 1, self.max_items - 1)
+            self.promote(slot)
+            self.balance(key)
+        else:
+            self.hot[slot] = 0
+            self.test[slot] = 1
+            self.enqueue(slot)
+
+    def promote(self, slot):
+        """
+        Make the key of a slot hot.
+
+        Args:
+            slot: The slot.
+        """
+        self.hot[slot] = 1
+        self.test[slot] = 0
+        self.hot_count += 1
+        self.enqueue(slot)
+
+    def demote(self, key):
+        """
+        Make the first unreferenced hot key cold, clearing the reference
+        bit of the hot keys passed on the way.
+
+        Args:
+            key: A key never demoted.
+        """
+        while True:
+            slot = self.next_slot(1)
+            if self.keys[slot] != key and not self.referenced[slot]:
+                self.hot[slot] = 0
+                self.hot_count -= 1
+                self.enqueue(slot)
+                return
+            self.referenced[slot] = 0
+            self.enqueue(slot)
+
+    def balance(self, key):
+        """
+        Demote hot keys until the hot slots fit their share.
+
+        Args:
+            key: The key just made hot, never demoted.
+        """
+        hot_limit = max(self.max_items - self.cold_target, 1)
+        while self.hot_count > hot_limit:
+            self.demote(key)
+
+    def victim(self, key):
+        """
+        Return the key to discard to make room for another key.
+
+        The cold hand passes the cold keys only. A referenced cold key
+        becomes hot if it is on test and gets a new test period
+        otherwise. The first unreferenced cold key is discarded. When
+        every key is hot, one is demoted first.
+
+        Args:
+            key: The key being stored.
+
+        Returns:
+            The key to discard, other than key.
+        """
+        while True:
+            slot = self.next_slot(0)
+            if slot is None:
+                self.demote(key)
+                continue
+            candidate = self.keys[slot]
+            if candidate == key:
+                self.enqueue(slot)
+                if len(self.hands[0]) == 1:
+                    self.demote(key)
+                continue
+            if not self.referenced[slot]:
+                return candidate
+            self.referenced[slot] = 0
+            if self.test[slot]:
+                self.promote(slot)
+                self.balance(candidate)
+            else:
+                self.test[slot] = 1
+                self.enqueue(slot)
+
+    def remove(self, key):
+        """
+        Remove a key from the cache and free its slot.
+
+        Args:
+            key: The cached key.
+        """
+        slot = self.slots[key]
+        if self.hot[slot]:
+            self.hot[slot] = 0
+            self.hot_count -= 1
+        super().remove(key)
+
+    def discard(self, key):
+        """
+        Remove a key to make room, remembering it if it was on test.
+
+        Args:
+            key: The cached key.
+        """
+        on_test = self.test[self.slots[key]]
+        super().discard(key)
+        if on_test:
+            self.ghosts[key] = None
+            if len(self.ghosts) > self.max_items:
+                self.ghosts.popitem(last=False)
+                self.cold_target = max(self.cold_target - 1, 1)
@@ -17,31 +17,39 @@ class LRUCache(BaseCaching):
     LRUCache class implementing a Least Recently Used based caching system.
     """
 
-    def __init__(self):
+    def __init__(self, **kwargs):
         """
         Initialize class instance.
+
+        Args:
+            kwargs: The capacity (max_items, max_bytes, weigher),
+                expiry (ttl, clock) and instrumentation (on_evict,
+                instrument, sample_every) options of BaseCaching.
         """
-        super().__init__()
+        super().__init__(**kwargs)
         self.cache_data = OrderedDict()
 
-    def put(self, key, item):
+    def put(self, key, item, ttl=None):
         """
         Add an item to the cache.
 
         Args:
             key: The key for the item.
             item: The item to be stored in the cache.
+            ttl: Seconds before the item expires, the cache default
+                when None.
 
         Returns:
             None
         """
+        self.sweep(key)
         if key and item:
-            self.cache_data[key] = item
-            self.cache_data.move_to_end(key)
-
-            if len(self.cache_data) > BaseCaching.MAX_ITEMS:
-                discarded_key = self.cache_data.popitem(last=False)
-                print(f"DISCARD: {discarded_key[0]}")
+            weight = self.weigh(key, item)
+            if key in self.cache_data:
+                self.cache_data.move_to_end(key)
+            if self.make_room(key, weight):
+                self.store(key, item, weight, ttl)
+                self.cache_data.move_to_end(key)
 
     def get(self, key):
         """
@@ -54,6 +62,19 @@ class LRUCache(BaseCaching):
             The cached item if found,
             or None if the key is not present in the cache.
         """
+        self.sweep(key)
         if key in self.cache_data:
             self.cache_data.move_to_end(key)
             return self.cache_data[key]
+
+    def victim(self, key):
+        """
+        Return the key to discard to make room for another key.
+
+        Args:
+            key: The key being stored.
+
+        Returns:
+            The least recently used key other than key.
+        """
+        return next(k for k in self.cache_data if k != key)
@@ -0,0 +1,141 @@
+#!/usr/bin/python3
+"""
+ShardedCache module implementing a thread-safe, lock-striped caching system.
+
+This module defines the ShardedCache class, which spreads keys over
+several independent instances of a caching policy by hash. Every shard
+has its own lock, so threads working on different shards never wait
+for each other, while each shard keeps the eviction order of its policy.
+"""
+
+from threading import Lock
+
+LRUCache = __import__('3-lru_cache').LRUCache
+
+
+class ShardedCache():
+    """
+    ShardedCache class wrapping a caching policy for concurrent access.
+    """
+
+    def __init__(self, policy=LRUCache, shards=16, **kwargs):
+        """
+        Initialize class instance.
+
+        Args:
+            policy: The BaseCaching subclass used by every shard.
+            shards: The number of shards.
+            kwargs: Arguments given to every shard (e.g. max_items or
+                ttl), so capacities are per shard.
+        """
+        assert shards > 0
+        self.shards = [policy(**kwargs) for _ in range(shards)]
+        self.locks = [Lock() for _ in range(shards)]
+        self.hits = [0] * shards
+        self.misses = [0] * shards
+        self.puts = [0] * shards
+
+    def shard(self, key):
+        """
+        Return the index of the shard holding a key.
+
+        Args:
+            key: The key.
+
+        Returns:
+            The shard index.
+        """
+        return hash(key) % len(self.shards)
+
+    def put(self, key, item, ttl=None):
+        """
+        Add an item to the cache.
+
+        Args:
+            key: The key for the item.
+            item: The item to be stored in the cache.
+            ttl: Seconds before the item expires, the cache default
+                when None.
+
+        Returns:
+            None
+        """
+        i = self.shard(key)
+        with self.locks[i]:
+            self.puts[i] += 1
+            self.shards[i].put(key, item, ttl)
+
+    def get(self, key):
+        """
+        Retrieve an item from the cache.
+
+        Args:
+            key: The key associated with the item to retrieve.
+
+        Returns:
+            The cached item if found,
+            or None if the key is not present in the cache.
+        """
+        i = self.shard(key)
+        with self.locks[i]:
+            item = self.shards[i].get(key)
+            if item is None:
+                self.misses[i] += 1
+            else:
+                self.hits[i] += 1
+            return item
+
+    def clear(self):
+        """
+        Remove every item of every shard.
+        """
+        for lock, shard in zip(self.locks, self.shards):
+            with lock:
+                shard.clear()
+
+    def stats(self):
+        """
+        Return statistics aggregated over every shard.
+
+        Returns:
+            A dictionary with the keys of BaseCaching.stats, summed over
+            the shards (hits, misses and puts are always counted here),
+            and the number of shards.
+        """
+        shard_stats = []
+        for lock, shard in zip(self.locks, self.shards):
+            with lock:
+                shard_stats.append(shard.stats())
+        totals = {
+            name: sum(stats[name] for stats in shard_stats)
+            for name in ("evictions", "expirations", "size", "bytes")
+        }
+        latency = None
+        for stats in shard_stats:
+            if stats["latency"] is None:
+                continue
+            latency = latency or {}
+            for name, histogram in stats["latency"].items():
+                merged = latency.setdefault(name, {})
+                for bound, count in histogram.items():
+                    merged[bound] = merged.get(bound, 0) + count
+        return {
+            "hits": sum(self.hits),
+            "misses": sum(self.misses),
+            "puts": sum(self.puts),
+            **totals,
+            "latency": latency,
+            "shards": len(self.shards),
+        }
+
+    def print_cache(self):
+        """
+        Print the items of every shard, sorted by key.
+        """
+        cache_data = {}
+        for lock, shard in zip(self.locks, self.shards):
+            with lock:
+                cache_data.update(shard.cache_data)
+        print("Current cache:")
+        for key in sorted(cache_data.keys()):
+            print("{}: {}".format(key, cache_data.get(key)))
@@ -1,19 +1,90 @@
 #!/usr/bin/python3
 """ BaseCaching module
 """
+import sys
+import time
+from timing_wheel import TimingWheel
+
+
+def deep_getsizeof(obj, seen=None):
+    """ Estimate the memory used by an object and everything it holds
+    """
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, bytearray, int, float)):
+        return size
+    if isinstance(obj, dict):
+        return size + sum(deep_getsizeof(key, seen) +
+                          deep_getsizeof(value, seen)
+                          for key, value in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(deep_getsizeof(value, seen) for value in obj)
+    if hasattr(obj, "__dict__"):
+        size += deep_getsizeof(vars(obj), seen)
+    return size
+
+
+def default_weigher(key, item):
+    """ Weigh a cache entry as the deep size of its key and item
+    """
+    return deep_getsizeof(key) + deep_getsizeof(item)
+
+
+def print_discard(key, item):
+    """ Report an evicted entry on the standard output
+    """
+    print(f"DISCARD: {key}")
 
 
 class BaseCaching():
     """ BaseCaching defines:
       - constants of your caching system
       - where your data are stored (in a dictionary)
+      - the capacity of an instance: max_items entries and, optionally,
+        max_bytes as measured by weigher(key, item)
+      - the lifetime of entries: ttl seconds by default, or per entry,
+        None for entries that never expire
+      - what happens to evicted entries: on_evict(key, item), which
+        prints DISCARD by default
+      - its statistics, see stats(); when instrument is True, get and
+        put are also counted, and every sample_every-th call is timed
     """
     MAX_ITEMS = 4
 
-    def __init__(self):
+    def __init__(self, max_items=None, max_bytes=None, weigher=None,
+                 ttl=None, clock=time.monotonic, on_evict=None,
+                 instrument=False, sample_every=64):
         """ Initiliaze
         """
+        if max_items is None:
+            max_items = BaseCaching.MAX_ITEMS
+        assert max_items > 0
+        assert max_bytes is None or max_bytes > 0
+        assert ttl is None or ttl > 0
+        assert sample_every > 0
         self.cache_data = {}
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.weigher = weigher or default_weigher
+        self.weights = {}
+        self.current_bytes = 0
+        self.ttl = ttl
+        self.clock = clock
+        self.deadlines = {}
+        self.wheel = None
+        self.on_evict = on_evict or print_discard
+        self.evictions = 0
+        self.expirations = 0
+        self.hits = 0
+        self.misses = 0
+        self.puts = 0
+        self.latency = None
+        if instrument:
+            self.instrument(sample_every)
 
     def print_cache(self):
         """ Print the cache
@@ -22,6 +93,79 @@ class BaseCaching():
         for key in sorted(self.cache_data.keys()):
             print("{}: {}".format(key, self.cache_data.get(key)))
 
+    def instrument(self, sample_every):
+        """ Count the calls of get and put, and time a sample of them
+
+        The methods are wrapped on the instance only, so a cache that
+        is not instrumented runs them unchanged.
+        """
+        get, put = self.get, self.put
+        timer = time.perf_counter_ns
+        get_times = [0] * 64
+        put_times = [0] * 64
+        self.latency = {"get": get_times, "put": put_times}
+
+        def timed_get(key):
+            """ Get an item by key, counting hits and misses
+            """
+            if (self.hits + self.misses) % sample_every:
+                item = get(key)
+            else:
+                start = timer()
+                item = get(key)
+                get_times[(timer() - start).bit_length()] += 1
+            if item is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return item
+
+        def timed_put(key, item, *args, **kwargs):
+            """ Add an item in the cache, counting puts
+            """
+            self.puts += 1
+            if self.puts % sample_every:
+                return put(key, item, *args, **kwargs)
+            start = timer()
+            put(key, item, *args, **kwargs)
+            put_times[(timer() - start).bit_length()] += 1
+
+        self.get = timed_get
+        self.put = timed_put
+
+    def stats(self):
+        """ Return the statistics of the cache
+
+        hits, misses and puts are only counted when the cache is
+        instrumented, and are None otherwise. latency is then a histogram
+        of the sampled calls of get and put: the number of calls that
+        took less than each power of two nanoseconds. bytes is tracked
+        when the cache has max_bytes, and the entries are weighed on
+        each call otherwise.
+        """
+        hits = misses = puts = latency = None
+        if self.latency is not None:
+            hits, misses, puts = self.hits, self.misses, self.puts
+            latency = {
+                name: {1 << i: count for i, count in enumerate(times)
+                       if count}
+                for name, times in self.latency.items()
+            }
+        weight = self.current_bytes
+        if self.max_bytes is None:
+            weight = sum(self.weigher(key, item)
+                         for key, item in self.cache_data.items())
+        return {
+            "hits": hits,
+            "misses": misses,
+            "puts": puts,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self.cache_data),
+            "bytes": weight,
+            "latency": latency,
+        }
+
     def put(self, key, item):
         """ Add an item in the cache
         """
@@ -31,3 +175,106 @@ class BaseCaching():
         """ Get an item by key
         """
         raise NotImplementedError("get must be implemented in your cache class")
+
+    def weigh(self, key, item):
+        """ Weigh an entry, 0 when the cache has no byte budget
+        """
+        if self.max_bytes is None:
+            return 0
+        return self.weigher(key, item)
+
+    def sweep(self, key=None):
+        """ Remove the expired entries the timing wheel has reached,
+        and key if it has expired
+        """
+        if self.wheel is None:
+            return
+        now = self.clock()
+        for expired in self.wheel.advance(now):
+            self.expire(expired)
+        deadline = self.deadlines.get(key)
+        if deadline is not None and deadline <= now:
+            self.expire(key)
+
+    def overflows(self, key, weight):
+        """ Tell whether storing key with weight would exceed the capacity
+        """
+        count = len(self.cache_data) + (key not in self.cache_data)
+        if count > self.max_items:
+            return True
+        if self.max_bytes is None:
+            return False
+        size = self.current_bytes - self.weights.get(key, 0) + weight
+        return size > self.max_bytes
+
+    def make_room(self, key, weight):
+        """ Discard victims until key with weight fits
+
+        Returns False, and leaves the cache untouched except for
+        dropping the previous value of key, when the entry alone
+        exceeds max_bytes.
+        """
+        if self.max_bytes is not None and weight > self.max_bytes:
+            if key in self.cache_data:
+                self.discard(key)
+            return False
+        if self.wheel is not None and self.overflows(key, weight):
+            now = self.clock()
+            for expired in self.wheel.upcoming():
+                if expired != key and self.deadlines[expired] <= now:
+                    self.expire(expired)
+        while self.overflows(key, weight):
+            self.discard(self.victim(key))
+        return True
+
+    def victim(self, key):
+        """ Return the key to discard next, never key itself
+        """
+        raise NotImplementedError("victim must be implemented "
+                                  "in your cache class")
+
+    def store(self, key, item, weight, ttl=None):
+        """ Store an entry, account for its weight and schedule its expiry
+        after ttl seconds, the default ttl when None
+        """
+        self.cache_data[key] = item
+        self.current_bytes += weight - self.weights.get(key, 0)
+        self.weights[key] = weight
+        ttl = self.ttl if ttl is None else ttl
+        if ttl is None:
+            if self.deadlines.pop(key, None) is not None:
+                self.wheel.cancel(key)
+            return
+        now = self.clock()
+        if self.wheel is None:
+            self.wheel = TimingWheel(now)
+        self.deadlines[key] = now + ttl
+        self.wheel.schedule(key, now + ttl)
+
+    def remove(self, key):
+        """ Remove an entry
+        """
+        del self.cache_data[key]
+        self.current_bytes -= self.weights.pop(key, 0)
+        if self.deadlines.pop(key, None) is not None:
+            self.wheel.cancel(key)
+
+    def clear(self):
+        """ Remove every entry, without reporting them to on_evict
+        """
+        for key in list(self.cache_data):
+            self.remove(key)
+
+    def expire(self, key):
+        """ Remove an expired entry
+        """
+        self.remove(key)
+        self.expirations += 1
+
+    def discard(self, key):
+        """ Remove an entry to make room and report it to on_evict
+        """
+        item = self.cache_data[key]
+        self.remove(key)
+        self.evictions += 1
+        self.on_evict(key, item)
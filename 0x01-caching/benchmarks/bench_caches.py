@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Caching Benchmarks
+
+This script compares the caching policies on a read-heavy workload:
+keys are drawn from a Zipf distribution, every key is looked up with get
+and put on a miss. It reports the hit ratio, the throughput of the whole
+workload, and the latency of hits alone, which is where CLOCK only sets
+a bit while LRU reorders its OrderedDict:
+
+    ./bench_caches.py
+    ./bench_caches.py --capacities 100000 1000000 --keys 10000000
+    ./bench_caches.py --policies lru clock clock-pro --skew 1.1
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import os
+import random
+import sys
+import time
+from typing import Dict, List
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+POLICIES = {
+    "fifo": __import__('1-fifo_cache').FIFOCache,
+    "lifo": __import__('2-lifo_cache').LIFOCache,
+    "lru": __import__('3-lru_cache').LRUCache,
+    "mru": __import__('4-mru_cache').MRUCache,
+    "lfu": __import__('100-lfu_cache').LFUCache,
+    "arc": __import__('101-arc_cache').ARCCache,
+    "tinylfu": __import__('102-tinylfu_cache').TinyLFUCache,
+    "clock": __import__('103-clock_cache').ClockCache,
+    "clock-pro": __import__('103-clock_cache').ClockProCache,
+}
+
+
+def zipf_keys(keys: int, skew: float, count: int, seed: int) -> List[int]:
+    """
+    Draw keys from a Zipf distribution.
+
+    Parameters:
+        - keys (int): The number of distinct keys, from 1 to keys.
+        - skew (float): The Zipf exponent, higher is more skewed.
+        - count (int): The number of keys to draw.
+        - seed (int): The random seed, for reproducible workloads.
+
+    Returns:
+        List[int]: The drawn keys.
+    """
+    weights = itertools.accumulate(1 / rank ** skew
+                                   for rank in range(1, keys + 1))
+    return random.Random(seed).choices(range(1, keys + 1),
+                                       cum_weights=list(weights), k=count)
+
+
+def run(policy: str, capacity: int, workload: List[int]) -> Dict:
+    """
+    Run a workload against a fresh cache, then time hits alone.
+
+    Parameters:
+        - policy (str): The name of the policy, see POLICIES.
+        - capacity (int): The max_items of the cache.
+        - workload (List[int]): The keys to look up.
+
+    Returns:
+        Dict: The hit ratio, the workload throughput in operations per
+        second and the mean latency of a hit in nanoseconds.
+    """
+    cache = POLICIES[policy](max_items=capacity)
+    hits = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for key in workload:
+            if cache.get(key) is None:
+                cache.put(key, key)
+            else:
+                hits += 1
+        elapsed = time.perf_counter() - start
+
+    resident = list(cache.cache_data)
+    lookups = [resident[i % len(resident)]
+               for i in range(len(workload))]
+    get = cache.get
+    start = time.perf_counter()
+    for key in lookups:
+        get(key)
+    hit_time = time.perf_counter() - start
+    return {
+        "hit_ratio": hits / len(workload),
+        "ops": len(workload) / elapsed,
+        "hit_ns": hit_time / len(lookups) * 1e9,
+    }
+
+
+def main() -> None:
+    """Parse the command line and print one line per policy and size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--policies", nargs="+", choices=POLICIES,
+                        default=["lru", "clock", "clock-pro", "arc",
+                                 "tinylfu"])
+    parser.add_argument("--capacities", nargs="+", type=int,
+                        default=[10000, 100000])
+    parser.add_argument("--keys", type=int, default=1000000,
+                        help="number of distinct keys")
+    parser.add_argument("--operations", type=int, default=500000)
+    parser.add_argument("--skew", type=float, default=0.9)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    workload = zipf_keys(args.keys, args.skew, args.operations, args.seed)
+    print("{:<10} {:>9} {:>9} {:>12} {:>8}".format(
+        "policy", "capacity", "hit ratio", "ops/s", "hit ns"))
+    for capacity in args.capacities:
+        for policy in args.policies:
+            result = run(policy, capacity, workload)
+            print("{:<10} {:>9} {:>9.4f} {:>12,.0f} {:>8.0f}".format(
+                policy, capacity, result["hit_ratio"], result["ops"],
+                result["hit_ns"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+"""
+CountMinSketch module implementing a compact frequency estimator.
+
+This module defines the CountMinSketch class, which estimates how often
+keys were seen with a few rows of small counters instead of a counter
+per key. A key maps to one counter per row, and its estimate is the
+smallest of them, so collisions can only make it too high. Counters
+are 4 bits wide, two to a byte, saturate at 15 and are all halved
+after a sample of additions, so the estimates follow recent popularity
+rather than all-time counts.
+"""
+
+from array import array
+
+SEED = 0x9E3779B97F4A7C15
+MASK64 = (1 << 64) - 1
+MAX_COUNT = 15
+HALVE = bytes((pair >> 1) & 0x77 for pair in range(256))
+
+
+class CountMinSketch():
+    """
+    CountMinSketch class estimating the recent frequency of keys.
+    """
+
+    def __init__(self, width, depth=4, sample_size=None):
+        """
+        Initialize class instance.
+
+        Args:
+            width: The number of counters per row, rounded up to a power
+                of two. About the number of distinct keys to tell apart.
+            depth: The number of rows.
+            sample_size: The number of additions after which every
+                counter is halved, 10 times the width by default.
+        """
+        assert width > 0 and depth > 0
+        width = 1 << (width - 1).bit_length()
+        self.width = width
+        self.depth = depth
+        self.mask = width - 1
+        self.rows = range(0, width * depth, width)
+        self.table = array("B", bytes((width * depth + 1) // 2))
+        self.sample_size = sample_size or 10 * width
+        self.additions = 0
+
+    def indexes(self, key):
+        """
+        Return the position of the counter of a key in every row.
+
+        The positions are derived from two halves of one mixed hash
+        (h1 + row * h2), which is as good as one hash per row.
+
+        Args:
+            key: The key.
+
+        Returns:
+            The list of positions in the table.
+        """
+        h = (hash(key) * SEED) & MASK64
+        h ^= h >> 29
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        mask = self.mask
+        return [offset + ((h1 + i * h2) & mask)
+                for i, offset in enumerate(self.rows)]
+
+    def counter(self, position):
+        """
+        Return the counter at a position of the table.
+
+        Args:
+            position: The position, whose byte holds the counter in its
+                low half if even, its high half if odd.
+
+        Returns:
+            The counter, from 0 to 15.
+        """
+        return (self.table[position >> 1] >> ((position & 1) << 2)) & 15
+
+    def increment(self, key):
+        """
+        Count one occurrence of a key.
+
+        Only the smallest counters of the key are increased, which keeps
+        the estimates of colliding keys lower.
+
+        Args:
+            key: The key.
+        """
+        positions = self.indexes(key)
+        counts = [self.counter(i) for i in positions]
+        smallest = min(counts)
+        if smallest < MAX_COUNT:
+            table = self.table
+            for i, count in zip(positions, counts):
+                if count == smallest:
+                    table[i >> 1] += 1 << ((i & 1) << 2)
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.reset()
+
+    def estimate(self, key):
+        """
+        Estimate how often a key was seen recently.
+
+        Args:
+            key: The key.
+
+        Returns:
+            The smallest counter of the key, from 0 to 15.
+        """
+        return min(self.counter(i) for i in self.indexes(key))
+
+    def reset(self):
+        """
+        Halve every counter, so old occurrences count less.
+
+        Both counters of a byte are shifted at once, and the bit moving
+        from the high counter into the low one is masked off.
+        """
+        self.table = array("B", self.table.tobytes().translate(HALVE))
+        self.additions //= 2
@@ -0,0 +1,126 @@
+#!/usr/bin/python3
+"""
+RingBuffer module implementing an insertion-ordered ring of keys.
+
+This module defines the RingBuffer class, which keeps keys in the order
+they were pushed in a preallocated list used as a ring, with a map from
+every key to its position. Pushing, removing any key, and finding the
+first or last key all run in constant time; removing a key from the
+middle leaves a hole that is skipped, and holes are squeezed out when
+the ring fills up, which happens at most once per capacity pushes.
+"""
+
+
+class RingBuffer():
+    """
+    RingBuffer class holding keys from first to last pushed.
+    """
+
+    def __init__(self, capacity):
+        """
+        Initialize class instance.
+
+        Args:
+            capacity: The number of slots. Twice the number of keys held
+                at once keeps the squeezing of holes rare.
+        """
+        assert capacity > 0
+        self.capacity = capacity
+        self.keys = [None] * capacity
+        self.positions = {}
+        self.head = 0
+        self.tail = 0
+
+    def __len__(self):
+        """
+        Return the number of keys.
+        """
+        return len(self.positions)
+
+    def __contains__(self, key):
+        """
+        Tell whether a key is in the ring.
+        """
+        return key in self.positions
+
+    def __iter__(self):
+        """
+        Iterate over the keys from first to last pushed.
+        """
+        for position in range(self.head, self.tail):
+            key = self.keys[position % self.capacity]
+            if key is not None:
+                yield key
+
+    def push(self, key):
+        """
+        Add a key after the last one.
+
+        Args:
+            key: A key not in the ring, other than None.
+        """
+        if self.tail - self.head == self.capacity:
+            self.compact()
+        assert self.tail - self.head < self.capacity, "ring buffer full"
+        self.keys[self.tail % self.capacity] = key
+        self.positions[key] = self.tail
+        self.tail += 1
+
+    def remove(self, key):
+        """
+        Remove a key, wherever it is.
+
+        Args:
+            key: A key in the ring.
+        """
+        position = self.positions.pop(key)
+        keys = self.keys
+        capacity = self.capacity
+        keys[position % capacity] = None
+        while self.head < self.tail and keys[self.head % capacity] is None:
+            self.head += 1
+        while (self.tail > self.head and
+               keys[(self.tail - 1) % capacity] is None):
+            self.tail -= 1
+
+    def first(self, exclude=None):
+        """
+        Return the first pushed key.
+
+        Args:
+            exclude: A key to skip.
+
+        Returns:
+            The first key other than exclude, None if there is none.
+        """
+        for position in range(self.head, self.tail):
+            key = self.keys[position % self.capacity]
+            if key is not None and key != exclude:
+                return key
+        return None
+
+    def last(self, exclude=None):
+        """
+        Return the last pushed key.
+
+        Args:
+            exclude: A key to skip.
+
+        Returns:
+            The last key other than exclude, None if there is none.
+        """
+        for position in range(self.tail - 1, self.head - 1, -1):
+            key = self.keys[position % self.capacity]
+            if key is not None and key != exclude:
+                return key
+        return None
+
+    def compact(self):
+        """
+        Move the keys to the start of the ring, squeezing out the holes.
+        """
+        keys = list(self)
+        self.keys = keys + [None] * (self.capacity - len(keys))
+        self.positions = {key: i for i, key in enumerate(keys)}
+        self.head = 0
+        self.tail = len(keys)
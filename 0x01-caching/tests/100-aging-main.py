@@ -0,0 +1,31 @@
+#!/usr/bin/python3
+""" 100-aging-main """
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+LFUCache = __import__('100-lfu_cache').LFUCache
+
+my_cache = LFUCache()
+my_cache.put("A", "Hot")
+for _ in range(10):
+    my_cache.get("A")
+for key in "BCDEFG":
+    my_cache.put(key, key)
+    my_cache.get(key)
+my_cache.print_cache()
+
+my_cache = LFUCache(aging_period=4)
+my_cache.put("A", "Hot")
+for _ in range(10):
+    my_cache.get("A")
+for key in "BCDEFG":
+    my_cache.put(key, key)
+    my_cache.get(key)
+    my_cache.get(key)
+my_cache.print_cache()
+print(my_cache.uses)
@@ -0,0 +1,59 @@
+#!/usr/bin/python3
+""" 103-main """
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+ClockCache = __import__('103-clock_cache').ClockCache
+ClockProCache = __import__('103-clock_cache').ClockProCache
+
+my_cache = ClockCache()
+my_cache.put("A", "Hello")
+my_cache.put("B", "World")
+my_cache.put("C", "Holberton")
+my_cache.put("D", "School")
+my_cache.print_cache()
+print(my_cache.get("B"))
+my_cache.put("E", "Battery")
+my_cache.print_cache()
+my_cache.put("C", "Street")
+my_cache.print_cache()
+print(my_cache.get("A"))
+print(my_cache.get("B"))
+print(my_cache.get("C"))
+my_cache.put("F", "Mission")
+my_cache.print_cache()
+my_cache.put("G", "San Francisco")
+my_cache.print_cache()
+my_cache.put("H", "H")
+my_cache.print_cache()
+my_cache.put("I", "I")
+my_cache.print_cache()
+print(my_cache.get("I"))
+print(my_cache.get("H"))
+print(my_cache.get("I"))
+print(my_cache.get("H"))
+print(my_cache.get("I"))
+print(my_cache.get("H"))
+my_cache.put("J", "J")
+my_cache.print_cache()
+my_cache.put("K", "K")
+my_cache.print_cache()
+my_cache.put("L", "L")
+my_cache.print_cache()
+my_cache.put("M", "M")
+my_cache.print_cache()
+
+# a cold key used again on test becomes hot and outlives a scan
+my_cache = ClockProCache(max_items=4)
+for key in ["A", "B", "C", "D"]:
+    my_cache.put(key, key.lower())
+my_cache.get("A")
+for key in ["S1", "S2", "S3", "S4"]:
+    my_cache.put(key, key.lower())
+my_cache.print_cache()
+print(my_cache.hot_count)
@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+""" 5-main """
+
+import sys
+import os
+from threading import Thread
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+ShardedCache = __import__('5-sharded_cache').ShardedCache
+LFUCache = __import__('100-lfu_cache').LFUCache
+
+my_cache = ShardedCache(shards=4, max_items=200)
+my_cache.put("A", "Hello")
+my_cache.put("B", "World")
+my_cache.put("C", "Holberton")
+my_cache.print_cache()
+print(my_cache.get("B"))
+print(my_cache.get("Z"))
+
+
+def worker(n):
+    """ Write then read back a range of keys """
+    keys = ["key-{}".format(i) for i in range(n * 50, n * 50 + 50)]
+    for key in keys:
+        my_cache.put(key, key.upper())
+    for key in keys:
+        assert my_cache.get(key) == key.upper()
+
+
+threads = [Thread(target=worker, args=(n,)) for n in range(8)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+print(my_cache.stats())
+
+lfu_cache = ShardedCache(LFUCache, shards=2, max_items=1000)
+for i in range(1, 11):
+    lfu_cache.put(i, i * 2)
+print(sum(lfu_cache.get(i) for i in range(1, 11)))
@@ -0,0 +1,58 @@
+#!/usr/bin/python3
+""" base_caching-main """
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+LRUCache = __import__('3-lru_cache').LRUCache
+LFUCache = __import__('100-lfu_cache').LFUCache
+
+# two caches of different sizes side by side
+small = LRUCache(max_items=2)
+large = LRUCache(max_items=6)
+for key in "ABCD":
+    small.put(key, key.lower())
+    large.put(key, key.lower())
+small.print_cache()
+large.print_cache()
+
+# a byte budget, weighing every item by its length
+my_cache = LFUCache(max_items=10, max_bytes=10,
+                    weigher=lambda key, item: len(item))
+my_cache.put("A", "aaa")
+my_cache.put("B", "bbb")
+my_cache.put("C", "ccc")
+print(my_cache.get("C"))
+print(my_cache.current_bytes)
+my_cache.put("D", "dddddddd")
+my_cache.print_cache()
+print(my_cache.current_bytes)
+my_cache.put("E", "e" * 11)
+my_cache.print_cache()
+
+# statistics, with evictions collected instead of printed
+evicted = []
+my_cache = LRUCache(max_items=2, instrument=True, sample_every=1,
+                    on_evict=lambda key, item: evicted.append((key, item)))
+my_cache.put("A", "Hello")
+my_cache.put("B", "World")
+print(my_cache.get("A"))
+print(my_cache.get("C"))
+my_cache.put("C", "Holberton")
+print(evicted)
+stats = my_cache.stats()
+print({name: value for name, value in stats.items() if name != "latency"})
+print(sum(stats["latency"]["get"].values()),
+      sum(stats["latency"]["put"].values()))
+print(LRUCache().stats()["latency"])
+
+# without instrumentation, the calls are not counted
+my_cache = LRUCache()
+my_cache.put("A", "Hello")
+print(my_cache.get("A"))
+stats = my_cache.stats()
+print(stats["hits"], stats["puts"], stats["bytes"] > 0)
@@ -0,0 +1,24 @@
+#!/usr/bin/python3
+""" count_min_sketch-main """
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+CountMinSketch = __import__('count_min_sketch').CountMinSketch
+
+sketch = CountMinSketch(16, sample_size=100)
+print(sketch.width, len(sketch.table))
+for _ in range(5):
+    sketch.increment("hot")
+sketch.increment("warm")
+print(sketch.estimate("hot"), sketch.estimate("warm"), sketch.estimate("cold"))
+for _ in range(20):
+    sketch.increment("hot")
+print(sketch.estimate("hot"))
+for i in range(74):
+    sketch.increment(i)
+print(sketch.additions, sketch.estimate("hot"))
@@ -0,0 +1,40 @@
+#!/usr/bin/python3
+""" ring_buffer-main """
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+RingBuffer = __import__('ring_buffer').RingBuffer
+FIFOCache = __import__('1-fifo_cache').FIFOCache
+LIFOCache = __import__('2-lifo_cache').LIFOCache
+
+ring = RingBuffer(4)
+for key in "ABCD":
+    ring.push(key)
+ring.remove("B")
+ring.remove("A")
+print(list(ring), ring.first(), ring.last(), ring.last("D"))
+ring.push("E")
+ring.push("F")
+print(list(ring), len(ring), ring.head, ring.tail)
+
+# the oldest key goes first, not the smallest one
+my_cache = FIFOCache()
+for key in ["D", "C", "B", "A"]:
+    my_cache.put(key, key.lower())
+my_cache.put("B", "updated")
+my_cache.put("E", "e")
+my_cache.print_cache()
+
+# an updated key counts as the last one in
+my_cache = LIFOCache()
+for key in ["A", "B", "C", "D"]:
+    my_cache.put(key, key.lower())
+my_cache.put("B", "updated")
+my_cache.put("E", "e")
+my_cache.put("F", "f")
+my_cache.print_cache()
@@ -0,0 +1,74 @@
+#!/usr/bin/python3
+""" timing_wheel-main """
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+TimingWheel = __import__('timing_wheel').TimingWheel
+LRUCache = __import__('3-lru_cache').LRUCache
+LFUCache = __import__('100-lfu_cache').LFUCache
+
+
+class Clock():
+    """ A clock moved by hand """
+
+    def __init__(self):
+        """ Start at 0 """
+        self.now = 0.0
+
+    def __call__(self):
+        """ Return the current time """
+        return self.now
+
+
+wheel = TimingWheel(0, resolution=1, slots=4, levels=2)
+for key, deadline in [("A", 2), ("B", 5), ("C", 17), ("D", 70)]:
+    wheel.schedule(key, deadline)
+wheel.cancel("B")
+print(wheel.advance(3))
+print(wheel.advance(16))
+print(wheel.advance(20))
+print(len(wheel), wheel.advance(100))
+
+clock = Clock()
+my_cache = LRUCache(ttl=10, clock=clock)
+my_cache.put("A", "Hello")
+my_cache.put("B", "World", ttl=30)
+my_cache.put("C", "Holberton", ttl=5)
+clock.now = 6
+print(my_cache.get("C"))
+my_cache.print_cache()
+clock.now = 10.05
+print(my_cache.get("A"))
+my_cache.put("D", "School")
+my_cache.put("E", "Battery")
+my_cache.put("F", "Mission")
+my_cache.print_cache()
+clock.now = 100
+my_cache.put("G", "San Francisco")
+my_cache.print_cache()
+
+clock = Clock()
+my_cache = LFUCache(clock=clock)
+my_cache.put("A", "Hello")
+my_cache.put("B", "World")
+my_cache.put("C", "Holberton", ttl=1)
+my_cache.put("D", "School")
+print(my_cache.get("C"))
+clock.now = 2
+my_cache.put("E", "Battery")
+my_cache.print_cache()
+
+# a deadline on a slot boundary still waits in level 1 when it passes
+clock = Clock()
+my_cache = LRUCache(max_items=2, clock=clock)
+my_cache.put("B", "World")
+my_cache.put("A", "Hello", ttl=12.75)
+clock.now = 12.76
+my_cache.put("C", "Holberton")
+my_cache.print_cache()
+print(my_cache.stats()["expirations"], my_cache.stats()["evictions"])
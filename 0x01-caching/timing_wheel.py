@@ -0,0 +1,197 @@
+#!/usr/bin/python3
+"""
+TimingWheel module implementing a hierarchical timing wheel.
+
+This module defines the TimingWheel class, which keeps keys scheduled
+to expire at given times. Time is cut into ticks, and every level of
+the wheel is a ring of slots, each slot of a level covering as many
+ticks as a whole turn of the level below. Advancing the wheel only
+stops on the ticks whose slot holds entries, and entries move down
+one level when the slot holding them comes around, so scheduling,
+cancelling and expiring an entry all cost amortised constant time no
+matter how many entries are waiting.
+"""
+
+import math
+
+
+class TimingWheel():
+    """
+    TimingWheel class scheduling keys for expiry.
+    """
+
+    def __init__(self, now, resolution=0.1, slots=64, levels=4):
+        """
+        Initialize class instance.
+
+        Args:
+            now: The current time, in seconds.
+            resolution: The length of a tick, in seconds.
+            slots: The number of slots of every level.
+            levels: The number of levels. Entries further away than
+                slots ** levels ticks wait in an overflow slot.
+        """
+        assert resolution > 0 and slots > 1 and levels > 0
+        self.resolution = resolution
+        self.slots = slots
+        self.levels = levels
+        self.current = math.floor(now / resolution)
+        self.wheels = [[{} for _ in range(slots)] for _ in range(levels)]
+        self.overflow = {}
+        self.where = {}
+
+    def __len__(self):
+        """
+        Return the number of scheduled keys.
+        """
+        return len(self.where)
+
+    def schedule(self, key, deadline):
+        """
+        Schedule a key, replacing its previous deadline if any.
+
+        Args:
+            key: The key.
+            deadline: The time at which the key expires, in seconds.
+        """
+        self.cancel(key)
+        tick = max(math.ceil(deadline / self.resolution), self.current + 1)
+        self.place(key, tick)
+
+    def place(self, key, tick):
+        """
+        Put a key in the slot covering its tick.
+
+        Args:
+            key: The key.
+            tick: The tick at which the key expires, after the current one.
+        """
+        delta = tick - self.current
+        span = 1
+        for level in range(self.levels):
+            if delta < span * self.slots:
+                slot = self.wheels[level][tick // span % self.slots]
+                break
+            span *= self.slots
+        else:
+            slot = self.overflow
+        slot[key] = tick
+        self.where[key] = slot
+
+    def cancel(self, key):
+        """
+        Unschedule a key, if it is scheduled.
+
+        Args:
+            key: The key.
+        """
+        slot = self.where.pop(key, None)
+        if slot is not None:
+            del slot[key]
+
+    def cascade(self, slot):
+        """
+        Move the keys of a slot to the slots covering their ticks now.
+
+        Args:
+            slot: The slot to empty.
+        """
+        entries = list(slot.items())
+        slot.clear()
+        for key, tick in entries:
+            self.place(key, tick)
+
+    def next_tick(self):
+        """
+        Return the next tick at which a slot has keys to expire or to
+        move down, so that advance skips the ticks with nothing to do.
+
+        Looks at most at one turn of every level, whatever the number
+        of ticks skipped.
+
+        Returns:
+            The tick, or None if no key is scheduled.
+        """
+        if not self.where:
+            return None
+        best = None
+        span = 1
+        for level in range(self.levels):
+            first = self.current // span + 1
+            if best is not None and first * span >= best:
+                return best
+            wheel = self.wheels[level]
+            for turn in range(first, first + self.slots):
+                if wheel[turn % self.slots]:
+                    if best is None or turn * span < best:
+                        best = turn * span
+                    break
+            span *= self.slots
+        if self.overflow:
+            tick = (self.current // span + 1) * span
+            if best is None or tick < best:
+                best = tick
+        return best
+
+    def advance(self, now):
+        """
+        Move the wheel forward to a given time.
+
+        Args:
+            now: The current time, in seconds.
+
+        Returns:
+            The list of keys whose deadline has passed.
+        """
+        target = math.floor(now / self.resolution)
+        if not self.where:
+            self.current = max(self.current, target)
+            return []
+        expired = []
+        while self.current < target:
+            tick = self.next_tick()
+            if tick is None or tick > target:
+                self.current = target
+                break
+            self.current = tick
+            if self.current % self.slots ** self.levels == 0:
+                self.cascade(self.overflow)
+            for level in range(self.levels - 1, 0, -1):
+                span = self.slots ** level
+                if self.current % span == 0:
+                    self.cascade(
+                        self.wheels[level][self.current // span % self.slots]
+                    )
+            slot = self.wheels[0][self.current % self.slots]
+            for key, tick in list(slot.items()):
+                if tick <= self.current:
+                    del slot[key]
+                    del self.where[key]
+                    expired.append(key)
+        return expired
+
+    def upcoming(self):
+        """
+        Return the keys due in the next tick.
+
+        Their deadline may already have passed, since the wheel only
+        expires keys once the tick they fall in is over. When the tick
+        starts a turn of higher levels, the keys still waiting there to
+        move down are included.
+
+        Returns:
+            The list of keys.
+        """
+        tick = self.current + 1
+        keys = []
+        span = 1
+        for level in range(self.levels):
+            if tick % span:
+                break
+            slot = self.wheels[level][tick // span % self.slots]
+            keys.extend(key for key, due in slot.items() if due == tick)
+            span *= self.slots
+        else:
+            keys.extend(key for key, due in self.overflow.items()
+                        if due == tick)
+        return keys
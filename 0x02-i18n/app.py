@@ -4,14 +4,38 @@ Route module for the API.
 
 Endpoints:
     - GET /: Renders the index.html template.
+    - GET /api/names: A page of baby names (page, page_size).
+    - GET /api/names/hyper: Hypermedia pagination (page, page_size).
+    - GET /api/names/hyper_index: Deletion-resilient pagination
+    (index, page_size).
+    - GET /api/names/export: Every baby name as streamed NDJSON.
 """
 
-from flask import Flask, render_template, request, g
+from flask import Flask, Response, abort, render_template, request, g
+from flask import stream_with_context
 from flask_babel import Babel, format_datetime
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Union
+from threading import Lock
+from typing import Iterator, Union
+import json
+import os
+import sys
 import pytz.exceptions
 
+PAGINATION_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "0x00-pagination"
+)
+sys.path.insert(0, PAGINATION_DIR)
+HyperServer = __import__("2-hypermedia_pagination").Server
+IndexServer = __import__("3-hypermedia_del_pagination").Server
+PayloadCache = __import__("payload_cache").PayloadCache
+
+
+servers = {}
+server_locks = {}
+servers_lock = Lock()
+payload_caches = {}
 
 users = {
     1: {"name": "Balou", "locale": "fr", "timezone": "Europe/Paris"},
@@ -32,6 +56,8 @@ class Config(object):
     LANGUAGES = ["en", "fr"]
     BABEL_DEFAULT_LOCALE = "en"
     BABEL_DEFAULT_TIMEZONE = "UTC"
+    PAGINATION_STORAGE = "list"
+    EXPORT_PAGE_SIZE = 1000
 
 
 app.config.from_object("app.Config")
@@ -75,6 +101,200 @@ def index() -> str:
     return render_template("index.html", current_time=current_time)
 
 
+def get_server(server_class: type):
+    """
+    Return the process-wide instance of a pagination Server class.
+
+    Instances are created on first use and shared by every request, so
+    the dataset and its indexes are only loaded once per process. They
+    are not thread-safe: requests use them through use_server.
+
+    Parameters:
+        - server_class (type): HyperServer or IndexServer.
+
+    Returns:
+        The shared Server instance.
+    """
+    server = servers.get(server_class)
+    if server is None:
+        with servers_lock:
+            server = servers.get(server_class)
+            if server is None:
+                server = server_class(app.config["PAGINATION_STORAGE"])
+                server.DATA_FILE = os.path.join(PAGINATION_DIR,
+                                                server.DATA_FILE)
+                server_locks[server_class] = Lock()
+                servers[server_class] = server
+    return server
+
+
+@contextmanager
+def use_server(server_class: type):
+    """
+    Lend the process-wide Server instance to one request at a time.
+
+    Parameters:
+        - server_class (type): HyperServer or IndexServer.
+
+    Yields:
+        The shared Server instance, while its lock is held.
+    """
+    server = get_server(server_class)
+    with server_locks[server_class]:
+        yield server
+
+
+def get_payloads(server) -> PayloadCache:
+    """
+    Return the encoded get_hyper responses of a HyperServer.
+
+    Must be called with the lock of the server held.
+
+    Parameters:
+        - server: The shared HyperServer instance.
+
+    Returns:
+        PayloadCache: The payload cache of the server.
+    """
+    if server not in payload_caches:
+        payload_caches[server] = PayloadCache(server)
+    return payload_caches[server]
+
+
+def json_response(body) -> Response:
+    """
+    Serialize a pagination result, pages being sequences of rows.
+
+    Parameters:
+        - body: The result to serialize.
+
+    Returns:
+        Response: The JSON response.
+    """
+    return Response(json.dumps(body, default=list),
+                    mimetype="application/json")
+
+
+def int_arg(name: str, default: Union[int, None]) -> Union[int, None]:
+    """
+    Read an integer query parameter.
+
+    Parameters:
+        - name (str): The parameter name.
+        - default (Union[int, None]): The value when it is missing.
+
+    Returns:
+        Union[int, None]: The parameter value.
+
+    Raises:
+        werkzeug.exceptions.BadRequest: If the value is not an integer.
+    """
+    value = request.args.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        abort(400)
+
+
+@app.route("/api/names", methods=["GET"])
+def names_page() -> Response:
+    """
+    Handle GET requests for a page of baby names.
+
+    Returns:
+        Response: The rows of the page, as a JSON list.
+    """
+    page = int_arg("page", 1)
+    page_size = int_arg("page_size", 10)
+    try:
+        with use_server(HyperServer) as server:
+            rows = server.get_page(page, page_size)
+    except AssertionError:
+        abort(400)
+    return json_response(rows)
+
+
+@app.route("/api/names/hyper", methods=["GET"])
+def names_hyper() -> Response:
+    """
+    Handle GET requests for a page of baby names with hypermedia links.
+
+    The JSON encoding of hot pages is cached, gzip-compressed for the
+    clients that accept it.
+
+    Returns:
+        Response: The get_hyper dictionary, as JSON.
+    """
+    page = int_arg("page", 1)
+    page_size = int_arg("page_size", 10)
+    compressed = "gzip" in request.accept_encodings
+    try:
+        with use_server(HyperServer) as server:
+            payload = get_payloads(server).get(page, page_size, compressed)
+    except AssertionError:
+        abort(400)
+    response = Response(payload, mimetype="application/json")
+    response.vary.add("Accept-Encoding")
+    if compressed:
+        response.headers["Content-Encoding"] = "gzip"
+    return response
+
+
+@app.route("/api/names/hyper_index", methods=["GET"])
+def names_hyper_index() -> Response:
+    """
+    Handle GET requests for a deletion-resilient page of baby names.
+
+    Returns:
+        Response: The get_hyper_index dictionary, as JSON.
+    """
+    index = int_arg("index", 0)
+    page_size = int_arg("page_size", 10)
+    if index < 0 or page_size <= 0:
+        abort(400)
+    try:
+        with use_server(IndexServer) as server:
+            hyper = server.get_hyper_index(index, page_size)
+    except AssertionError:
+        abort(400)
+    return json_response(hyper)
+
+
+@app.route("/api/names/export", methods=["GET"])
+def names_export() -> Response:
+    """
+    Handle GET requests for every baby name, as newline-delimited JSON.
+
+    The body is generated one page at a time while it is sent, so the
+    whole export is never held in memory.
+
+    Returns:
+        Response: A streamed application/x-ndjson response, one object
+        per row keyed by the CSV header.
+    """
+    with use_server(HyperServer) as server:
+        header = server.header()
+        pages = server.iter_pages(app.config["EXPORT_PAGE_SIZE"])
+
+    def generate() -> Iterator[str]:
+        """Yield the NDJSON lines of each page, one page per lock."""
+        while True:
+            with use_server(HyperServer):
+                page = next(pages, None)
+                if page is None:
+                    return
+                lines = "".join(
+                    json.dumps(dict(zip(header, row))) + "\n"
+                    for row in page
+                )
+            yield lines
+
+    return Response(stream_with_context(generate()),
+                    mimetype="application/x-ndjson")
+
+
 @babel.localeselector
 def get_locale() -> str:
     """
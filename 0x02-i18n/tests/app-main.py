@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+import gzip
+import json
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+))
+
+app = __import__('app').app
+client = app.test_client()
+
+res = client.get("/api/names?page=2&page_size=3")
+print(res.status_code, len(res.get_json()))
+print(client.get("/api/names?page=0").status_code)
+print(client.get("/api/names?page=abc").status_code)
+
+res = client.get("/api/names/hyper?page=2&page_size=3")
+hyper = res.get_json()
+print(res.status_code, hyper["page"], hyper["next_page"], hyper["prev_page"])
+res = client.get("/api/names/hyper?page=2&page_size=3",
+                 headers={"Accept-Encoding": "gzip"})
+print(res.status_code, res.headers.get("Content-Encoding"),
+      json.loads(gzip.decompress(res.data)) == hyper)
+print(client.get("/api/names/hyper?page_size=-5").status_code)
+
+res = client.get("/api/names/hyper_index?index=3&page_size=2")
+hyper = res.get_json()
+print(res.status_code, hyper["index"], hyper["next_index"])
+print(client.get("/api/names/hyper_index?index=-1").status_code)
+print(client.get("/api/names/hyper_index?page_size=0").status_code)
+
+res = client.get("/api/names/export")
+lines = res.get_data(as_text=True).splitlines()
+print(res.status_code, res.mimetype, len(lines))
+print(json.loads(lines[0]))